@@ -1,24 +1,63 @@
 
 # check_models.py
+import json
 import os
-import google.generativeai as genai
+import time
+from pathlib import Path
+
 from dotenv import load_dotenv
 
-# 환경변수 로드
-load_dotenv()
-api_key = os.getenv("GEMINI_API_KEY")
+# 모델 목록 캐시 (1시간 이내 재실행 시 구글 서버 호출 생략)
+CACHE_PATH = Path.home() / ".cache" / "with-quasar-oppa" / "models.json"
+CACHE_TTL_SEC = 3600
+
+
+def _load_cached_models():
+    try:
+        if time.time() - CACHE_PATH.stat().st_mtime < CACHE_TTL_SEC:
+            return json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_cached_models(models):
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(models, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass
+
+
+models = _load_cached_models()
+
+if models is not None:
+    print(f">>> 캐시된 모델 목록을 사용합니다 ({CACHE_PATH})")
+    for name, methods in models:
+        if 'generateContent' in methods:
+            print(f"- 발견된 모델: {name}")
+else:
+    import google.generativeai as genai
+
+    # 환경변수 로드
+    load_dotenv()
+    api_key = os.getenv("GEMINI_API_KEY")
+
+    # REST 방식으로 설정 (선생님 환경에 맞춤)
+    genai.configure(api_key=api_key, transport='rest')
 
-# REST 방식으로 설정 (선생님 환경에 맞춤)
-genai.configure(api_key=api_key, transport='rest')
+    print(">>> 구글 서버에 사용 가능한 모델 목록을 요청합니다...")
 
-print(">>> 구글 서버에 사용 가능한 모델 목록을 요청합니다...")
+    try:
+        # 모델 목록 조회
+        models = []
+        for m in genai.list_models():
+            models.append((m.name, list(m.supported_generation_methods)))
+            if 'generateContent' in m.supported_generation_methods:
+                print(f"- 발견된 모델: {m.name}")
+        _save_cached_models(models)
 
-try:
-    # 모델 목록 조회
-    for m in genai.list_models():
-        if 'generateContent' in m.supported_generation_methods:
-            print(f"- 발견된 모델: {m.name}")
-            
-except Exception as e:
-    print(f"\n[에러 발생] 목록을 가져오지 못했습니다:\n{e}")
-    
\ No newline at end of file
+    except Exception as e:
+        print(f"\n[에러 발생] 목록을 가져오지 못했습니다:\n{e}")
@@ -13,21 +13,41 @@ Version: 2.0
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
+from datetime import date, datetime
+from enum import IntEnum
+from itertools import groupby
 from typing import Optional, Any
 
+# 유틸리티 정규식 (호출마다 컴파일·캐시 조회하지 않도록 모듈 로드 시 1회 컴파일)
+_NUM_CLEAN = re.compile(r"[,\s]", re.ASCII)
+_NUM_EXTRACT = re.compile(r"[\d.]+", re.ASCII)
+# 비교용 정규화에서 제거할 문자 (공백류·하이픈·밑줄·마침표·콤마) — str.translate 테이블
+_NORM_TABLE = str.maketrans("", "", " \t\n\r\f\v-_.,")
+_PHONE_STRIP = re.compile(r"[\s\-]")
 
-class ConfidenceLevel(str, Enum):
-    """신뢰도 수준"""
-    HIGH = "높음"           # 99% 이상 확신
-    MEDIUM = "중간"         # 80~99% 확신
-    LOW = "낮음"            # 60~80% 확신
-    MANUAL_CHECK = "수동확인필요"  # 60% 미만, 반드시 사람이 확인
+# ISO 날짜 고속 경로용 바운드 메서드 (호출마다 속성 조회 생략)
+_fromiso = date.fromisoformat
 
 
-@dataclass
+class ConfidenceLevel(IntEnum):
+    """신뢰도 수준 (정수 코드 — 비교·정렬·min/max 집계가 정수 연산, 표시는 label)"""
+    HIGH = 3            # 99% 이상 확신
+    MEDIUM = 2          # 80~99% 확신
+    LOW = 1             # 60~80% 확신
+    MANUAL_CHECK = 0    # 60% 미만, 반드시 사람이 확인
+
+    @property
+    def label(self) -> str:
+        """화면·리포트 표시용 한글 명칭"""
+        return _CONFIDENCE_LABELS[self]
+
+
+_CONFIDENCE_LABELS = ("수동확인필요", "낮음", "중간", "높음")
+
+
+@dataclass(slots=True)
 class ValidationItem:
     """개별 검증 항목 결과"""
     field_name: str                          # 필드명
@@ -39,7 +59,20 @@ class ValidationItem:
     manual_check_reason: Optional[str] = None  # 수동확인 필요 사유
 
 
-@dataclass  
+def _missing_item(field_name: str, issue: str, reason: str, method: str = "정규식") -> ValidationItem:
+    """값 미추출 시의 결과 항목 (호출마다 새 인스턴스 — 리포트에서 항목을 수정해도 다른 결과에 영향 없음)"""
+    return ValidationItem(
+        field_name=field_name,
+        extracted_value=None,
+        is_valid=False,
+        confidence=ConfidenceLevel.MANUAL_CHECK,
+        validation_method=method,
+        issues=[issue],
+        manual_check_reason=reason,
+    )
+
+
+@dataclass(slots=True)
 class DualValidationResult:
     """이중 검증 결과"""
     field_name: str
@@ -60,38 +93,43 @@ class AdvancedValidator:
     # 인감 일치율 기준
     SEAL_MATCH_THRESHOLD = 45.0
     
-    # 정규식 패턴 정의
+    # 정규식 패턴 정의 (re.ASCII: \d·\s를 ASCII 범위로 한정해 문자 분류 비용 절감)
     PATTERNS = {
         # 날짜 패턴들
-        "date_yyyy_mm_dd": re.compile(r"^\d{4}-\d{2}-\d{2}$"),
-        "date_yyyy_dot": re.compile(r"^\d{4}\.\d{1,2}\.\d{1,2}$"),
-        "date_korean": re.compile(r"^\d{4}년\s*\d{1,2}월\s*\d{1,2}일$"),
+        "date_yyyy_mm_dd": re.compile(r"^\d{4}-\d{2}-\d{2}$", re.ASCII),
+        "date_yyyy_dot": re.compile(r"^\d{4}\.\d{1,2}\.\d{1,2}$", re.ASCII),
+        "date_korean": re.compile(r"^\d{4}년\s*\d{1,2}월\s*\d{1,2}일$", re.ASCII),
         
         # 면적 패턴 (㎡, m², 제곱미터)
-        "area": re.compile(r"^[\d,]+\.?\d*\s*(㎡|m²|m2|제곱미터)?$"),
+        # 정수부는 '콤마 3자리 그룹' 또는 '콤마 없는 숫자' 중 하나로만 매칭되도록 분리 —
+        # 각 위치의 매칭 방법이 하나뿐이라 긴 OCR 문자열에서도 선형 시간 (이전 [\d,]+\.?\d* 는 O(n²) 백트래킹)
+        "area": re.compile(r"^(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d*)?\s*(㎡|m²|m2|제곱미터)?$", re.ASCII),
         
         # 금액 패턴
-        "amount": re.compile(r"^[\d,]+\s*(원|만원|억원)?$"),
+        "amount": re.compile(r"^[\d,]+\s*(원|만원|억원)?$", re.ASCII),
         
         # 전화번호 패턴
-        "phone": re.compile(r"^0\d{1,2}-?\d{3,4}-?\d{4}$"),
+        "phone": re.compile(r"^0\d{1,2}-?\d{3,4}-?\d{4}$", re.ASCII),
         
         # 이메일 패턴
-        "email": re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"),
+        "email": re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", re.ASCII),
         
         # 주민등록번호 패턴 (앞자리만)
-        "resident_id_front": re.compile(r"^\d{6}$"),
+        "resident_id_front": re.compile(r"^\d{6}$", re.ASCII),
         
         # 사업자등록번호 패턴
-        "business_id": re.compile(r"^\d{3}-\d{2}-\d{5}$"),
+        "business_id": re.compile(r"^\d{3}-\d{2}-\d{5}$", re.ASCII),
         
         # 호수 패턴
-        "unit_number": re.compile(r"^\d{1,4}호?$"),
+        "unit_number": re.compile(r"^\d{1,4}호?$", re.ASCII),
         
         # 층수 패턴
-        "floor": re.compile(r"^(지하\s*)?\d{1,3}\s*층?$"),
+        "floor": re.compile(r"^(지하\s*)?\d{1,3}\s*층?$", re.ASCII),
     }
     
+    # 날짜 파싱용 단일 정규식 (YYYY-MM-DD / YYYY.MM.DD / YYYY. MM. DD / YYYY년 MM월 DD일 통합)
+    _DATE_RE = re.compile(r"^\s*(\d{4})[-./\s년]\s*(\d{1,2})[-./\s월]\s*(\d{1,2})\s*일?\s*$", re.ASCII)
+    
     # 전용면적 기준 (16㎡ 이상 85㎡ 이하)
     MIN_EXCLUSIVE_AREA = 16.0
     MAX_EXCLUSIVE_AREA = 85.0
@@ -104,7 +142,11 @@ class AdvancedValidator:
         self.announcement_date = datetime.strptime(announcement_date, "%Y-%m-%d").date()
         self.validation_results: list[ValidationItem] = []
         self.dual_results: list[DualValidationResult] = []
-        self.manual_check_items: list[ValidationItem] = []
+        # 수동확인 항목은 validation_results 내 인덱스로만 보관 (참조 중복 저장 안 함)
+        self._manual_idx: list[int] = []
+        # 리포트용 누적 카운터 (add_validation에서 갱신 — generate_report 재스캔 불필요)
+        self._valid_count = 0
+        self._high_count = 0
     
     # =========================================================================
     # 1. 정규식 기반 형식 검증
@@ -113,24 +155,26 @@ class AdvancedValidator:
     def validate_date_format(self, value: Optional[str], field_name: str) -> ValidationItem:
         """날짜 형식 검증"""
         if not value:
+            return _missing_item(field_name, "날짜 미기재", "날짜가 추출되지 않음")
+        
+        value = value.strip()
+        
+        # 고정폭 YYYY-MM-DD (대부분의 추출값) — 정규식 없이 문자 비교로 바로 판정
+        if (len(value) == 10 and value[4] == "-" and value[7] == "-" and value.isascii()
+                and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()):
             return ValidationItem(
                 field_name=field_name,
-                extracted_value=None,
-                is_valid=False,
-                confidence=ConfidenceLevel.MANUAL_CHECK,
-                validation_method="정규식",
-                issues=["날짜 미기재"],
-                manual_check_reason="날짜가 추출되지 않음"
+                extracted_value=value,
+                is_valid=True,
+                confidence=ConfidenceLevel.HIGH,
+                validation_method="정규식"
             )
         
-        value = value.strip()
-        
         # 여러 날짜 형식 체크
-        is_valid = any([
-            self.PATTERNS["date_yyyy_mm_dd"].match(value),
-            self.PATTERNS["date_yyyy_dot"].match(value),
-            self.PATTERNS["date_korean"].match(value),
-        ])
+        is_valid = any(
+            self.PATTERNS[k].match(value)
+            for k in ("date_yyyy_mm_dd", "date_yyyy_dot", "date_korean")
+        )
         
         if is_valid:
             return ValidationItem(
@@ -198,15 +242,7 @@ class AdvancedValidator:
     def validate_area_format(self, value: Optional[str], field_name: str) -> ValidationItem:
         """면적 형식 검증"""
         if not value:
-            return ValidationItem(
-                field_name=field_name,
-                extracted_value=None,
-                is_valid=False,
-                confidence=ConfidenceLevel.MANUAL_CHECK,
-                validation_method="정규식",
-                issues=["면적 미기재"],
-                manual_check_reason="면적이 추출되지 않음"
-            )
+            return _missing_item(field_name, "면적 미기재", "면적이 추출되지 않음")
         
         value = str(value).strip()
         
@@ -276,20 +312,12 @@ class AdvancedValidator:
     def validate_phone_format(self, value: Optional[str], field_name: str) -> ValidationItem:
         """전화번호 형식 검증"""
         if not value:
-            return ValidationItem(
-                field_name=field_name,
-                extracted_value=None,
-                is_valid=False,
-                confidence=ConfidenceLevel.MANUAL_CHECK,
-                validation_method="정규식",
-                issues=["전화번호 미기재"],
-                manual_check_reason="전화번호가 추출되지 않음"
-            )
+            return _missing_item(field_name, "전화번호 미기재", "전화번호가 추출되지 않음")
         
-        # 공백, 하이픈 정규화
-        normalized = re.sub(r"[\s\-]", "", value.strip())
+        # 공백, 하이픈 정규화 (하이픈 포함 원본이 매칭되면 정규화 값도 항상 매칭되므로 1회만 검사)
+        normalized = _PHONE_STRIP.sub("", value.strip())
         
-        if self.PATTERNS["phone"].match(normalized) or self.PATTERNS["phone"].match(value):
+        if self.PATTERNS["phone"].match(normalized):
             return ValidationItem(
                 field_name=field_name,
                 extracted_value=value,
@@ -311,15 +339,7 @@ class AdvancedValidator:
     def validate_email_format(self, value: Optional[str], field_name: str) -> ValidationItem:
         """이메일 형식 검증"""
         if not value:
-            return ValidationItem(
-                field_name=field_name,
-                extracted_value=None,
-                is_valid=False,
-                confidence=ConfidenceLevel.MANUAL_CHECK,
-                validation_method="정규식",
-                issues=["이메일 미기재"],
-                manual_check_reason="이메일이 추출되지 않음"
-            )
+            return _missing_item(field_name, "이메일 미기재", "이메일이 추출되지 않음")
         
         value = value.strip()
         
@@ -353,15 +373,7 @@ class AdvancedValidator:
     ) -> ValidationItem:
         """인감 일치율 검증 (기준: 45%)"""
         if match_rate is None:
-            return ValidationItem(
-                field_name=field_name,
-                extracted_value=None,
-                is_valid=False,
-                confidence=ConfidenceLevel.MANUAL_CHECK,
-                validation_method="인감비교",
-                issues=["인감 일치율 측정 불가"],
-                manual_check_reason="인감 이미지 인식 실패"
-            )
+            return _missing_item(field_name, "인감 일치율 측정 불가", "인감 이미지 인식 실패", "인감비교")
         
         if match_rate >= self.SEAL_MATCH_THRESHOLD:
             # 45% 이상: 정상
@@ -427,6 +439,20 @@ class AdvancedValidator:
                 manual_check_reason="2개 이상 서류에서 값 추출 필요"
             )
         
+        # 일치 시에는 합의된 값(첫 서류 값)만 기록 — dict repr은 불일치(사람 확인) 경로에서만 생성
+        agreed_value = next(iter(non_null_values.values()))
+        
+        # 모든 서류 값이 문자 그대로 같으면 숫자 추출·정규화 없이 바로 일치 처리
+        if len(set(non_null_values.values())) == 1:
+            return ValidationItem(
+                field_name=field_name,
+                extracted_value=agreed_value,
+                is_valid=True,
+                confidence=ConfidenceLevel.HIGH,
+                validation_method="교차검증",
+                issues=[]
+            )
+        
         # 숫자 값들 추출 시도
         numeric_values = {}
         for doc, val in non_null_values.items():
@@ -436,17 +462,15 @@ class AdvancedValidator:
         
         # 숫자 비교 가능한 경우
         if len(numeric_values) >= 2:
-            nums = list(numeric_values.values())
-            base = nums[0]
-            all_match = all(
-                abs(n - base) / base <= tolerance if base > 0 else n == base
-                for n in nums
-            )
+            nums = numeric_values.values()
+            # 최댓값 대비 범위(최대-최소)로 1회 판정 — 기준 서류 순서와 무관, 0이면 전부 0일 때만 일치
+            mn, mx = min(nums), max(nums)
+            all_match = (mx - mn) <= tolerance * mx if mx > 0 else mn == mx
             
             if all_match:
                 return ValidationItem(
                     field_name=field_name,
-                    extracted_value=str(non_null_values),
+                    extracted_value=agreed_value,
                     is_valid=True,
                     confidence=ConfidenceLevel.HIGH,
                     validation_method="교차검증",
@@ -469,7 +493,7 @@ class AdvancedValidator:
         if len(set(normalized)) == 1:
             return ValidationItem(
                 field_name=field_name,
-                extracted_value=str(non_null_values),
+                extracted_value=agreed_value,
                 is_valid=True,
                 confidence=ConfidenceLevel.HIGH,
                 validation_method="교차검증",
@@ -565,45 +589,34 @@ class AdvancedValidator:
     # 5. 유틸리티 메서드
     # =========================================================================
     
-    def _parse_date(self, value: str) -> Optional[datetime.date]:
-        """다양한 형식의 날짜 파싱"""
-        value = value.strip()
-        
-        formats = [
-            "%Y-%m-%d",
-            "%Y.%m.%d",
-            "%Y. %m. %d",
-            "%Y년 %m월 %d일",
-            "%Y년%m월%d일",
-        ]
-        
-        for fmt in formats:
+    def _parse_date(self, value: str) -> Optional[date]:
+        """다양한 형식의 날짜 파싱 (ISO는 fromisoformat, 그 외 정규식 1회 스캔 후 date 직접 생성)"""
+        if len(value) == 10 and value[4] == "-" and value[7] == "-":
             try:
-                return datetime.strptime(value, fmt).date()
+                return _fromiso(value)
             except ValueError:
-                continue
-        
-        # 숫자만 추출해서 시도
-        numbers = re.findall(r"\d+", value)
-        if len(numbers) >= 3:
-            try:
-                year = int(numbers[0])
-                month = int(numbers[1])
-                day = int(numbers[2])
-                return datetime(year, month, day).date()
-            except (ValueError, IndexError):
                 pass
-        
-        return None
+        m = self._DATE_RE.match(value)
+        if m is not None:
+            ymd = (int(m[1]), int(m[2]), int(m[3]))
+        else:
+            # 표준 형식 외 (접두어·'/' 구분 등): 연속 숫자 구간 3개를 연·월·일로 사용 (정규식 없이 1회 스캔)
+            ymd = tuple(int("".join(g)) for k, g in groupby(value, str.isdecimal) if k)[:3]
+            if len(ymd) < 3:
+                return None
+        try:
+            return date(*ymd)
+        except ValueError:  # 존재하지 않는 날짜 (2월 30일 등)
+            return None
     
     def _extract_number(self, value: str) -> Optional[float]:
         """문자열에서 숫자 추출"""
         if not value:
             return None
         
-        # 콤마 제거하고 숫자 추출
-        cleaned = re.sub(r"[,\s]", "", str(value))
-        match = re.search(r"[\d.]+", cleaned)
+        # 콤마·공백 제거 후 숫자 추출 (OCR 결과의 "84. 5㎡", "1 234" 같은 띄어쓰기 허용)
+        cleaned = _NUM_CLEAN.sub("", str(value))
+        match = _NUM_EXTRACT.search(cleaned)
         
         if match:
             try:
@@ -619,18 +632,29 @@ class AdvancedValidator:
             return ""
         
         # 공백, 특수문자 제거, 소문자 변환
-        normalized = re.sub(r"[\s\-_.,]", "", str(value).lower())
-        return normalized
+        return str(value).lower().translate(_NORM_TABLE)
     
     # =========================================================================
     # 6. 종합 검증 리포트
     # =========================================================================
     
+    @property
+    def manual_check_items(self) -> list[ValidationItem]:
+        """수동확인 필요 항목 (인덱스 목록에서 필요할 때만 구성)"""
+        return [self.validation_results[i] for i in self._manual_idx]
+    
     def add_validation(self, item: ValidationItem) -> None:
         """검증 결과 추가"""
+        # 반복되는 필드명·검증방법 문자열은 인턴해 동일 객체 공유 (장시간 실행 시 문자열 객체 수 절감)
+        item.field_name = sys.intern(item.field_name)
+        item.validation_method = sys.intern(item.validation_method)
         self.validation_results.append(item)
-        if item.confidence == ConfidenceLevel.MANUAL_CHECK:
-            self.manual_check_items.append(item)
+        if item.is_valid:
+            self._valid_count += 1
+        if item.confidence is ConfidenceLevel.HIGH:
+            self._high_count += 1
+        if item.confidence is ConfidenceLevel.MANUAL_CHECK:
+            self._manual_idx.append(len(self.validation_results) - 1)
     
     def add_dual_validation(self, result: DualValidationResult) -> None:
         """이중 검증 결과 추가"""
@@ -639,13 +663,29 @@ class AdvancedValidator:
     def generate_report(self) -> dict:
         """종합 검증 리포트 생성"""
         total = len(self.validation_results)
-        valid_count = sum(1 for v in self.validation_results if v.is_valid)
-        manual_check_count = len(self.manual_check_items)
-        
-        high_confidence = sum(
-            1 for v in self.validation_results 
-            if v.confidence == ConfidenceLevel.HIGH
-        )
+        valid_count = self._valid_count
+        manual_check_count = len(self._manual_idx)
+        high_confidence = self._high_count
+        
+        # validation_results 1회 순회로 전체 목록과 수동확인 목록을 함께 구성
+        all_validations = []
+        manual_items = []
+        for v in self.validation_results:
+            all_validations.append({
+                "field": v.field_name,
+                "value": v.extracted_value,
+                "valid": v.is_valid,
+                "confidence": v.confidence.label,
+                "method": v.validation_method,
+                "issues": v.issues,
+            })
+            if v.confidence is ConfidenceLevel.MANUAL_CHECK:
+                manual_items.append({
+                    "field": v.field_name,
+                    "value": v.extracted_value,
+                    "reason": v.manual_check_reason,
+                    "issues": v.issues,
+                })
         
         return {
             "summary": {
@@ -655,15 +695,7 @@ class AdvancedValidator:
                 "manual_check_required": manual_check_count,
                 "high_confidence_rate": f"{(high_confidence/total*100):.1f}%" if total > 0 else "N/A",
             },
-            "manual_check_items": [
-                {
-                    "field": item.field_name,
-                    "value": item.extracted_value,
-                    "reason": item.manual_check_reason,
-                    "issues": item.issues,
-                }
-                for item in self.manual_check_items
-            ],
+            "manual_check_items": manual_items,
             "dual_validation_inconsistencies": [
                 {
                     "field": r.field_name,
@@ -672,15 +704,5 @@ class AdvancedValidator:
                 }
                 for r in self.dual_results if not r.is_consistent
             ],
-            "all_validations": [
-                {
-                    "field": v.field_name,
-                    "value": v.extracted_value,
-                    "valid": v.is_valid,
-                    "confidence": v.confidence.value,
-                    "method": v.validation_method,
-                    "issues": v.issues,
-                }
-                for v in self.validation_results
-            ]
+            "all_validations": all_validations,
         }
@@ -9,12 +9,20 @@
 """
 from __future__ import annotations
 
+import io
 import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 from core.exclusion_rules import (
     ExclusionRule,
     ExclusionCategory,
@@ -25,6 +33,74 @@ from core.exclusion_rules import (
 )
 
 
+# 파서가 결과에 쓰는 정규 키/값 — 인턴된 단일 객체로 공유 (한글 리터럴은 자동 인턴되지 않음)
+_K_GENERAL = sys.intern("일반")
+_K_YOUTH = sys.intern("청년")
+_K_NEWLYWED = sys.intern("신혼신생아")
+_K_MULTI = sys.intern("다자녀")
+_K_MIN_START = sys.intern("min_construction_start")
+_K_MIN_APPROVAL = sys.intern("min_approval_date")
+_T_MULTI_FAMILY = sys.intern("다가구")
+_T_COMMON = sys.intern("공동주택")
+_T_URBAN = sys.intern("도시형생활주택")
+_T_OFFICETEL = sys.intern("주거용오피스텔")
+
+# 파싱용 정규식 (모듈 로드 시 1회 컴파일)
+_RE_TITLES = (
+    re.compile(r"(\d{4}년도?\s*\S+지역\s*기존주택\s*매입\s*공고)"),
+    re.compile(r"(\d{4}년\s*\S+\s*기존주택매입공고)"),
+)
+# 공고일은 관례상 문서 말미에 위치 — 꼬리 구간만 먼저 검사
+_DATE_TAIL_WINDOW = 1024
+_RE_DATE_END = re.compile(r"(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.\s*$", re.MULTILINE)
+_RE_DATE_LABELED = re.compile(r"공고일?\s*[:：]?\s*(\d{4})[.\s]*(\d{1,2})[.\s]*(\d{1,2})")
+_RE_DATE_KOREAN = re.compile(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일")
+_RE_APPLY_START = re.compile(r"신청기간\s*[:：]?\s*(\d{4})\.(\d{1,2})\.(\d{1,2})")
+_RE_APPLY_END = re.compile(r"[~～∼]\s*(\d{4})\.(\d{1,2})\.(\d{1,2})")
+_RE_MIN_UNITS = re.compile(r"(\d+)호\s*이상\s*건물")
+# 면적/건령 기준: 분류 키워드를 하나의 교대식으로 묶어 1회 스캔
+# (전방탐색으로 감싸 같은 줄에 여러 분류가 있어도 분류별 첫 매칭을 모두 찾음)
+_RE_AREA = re.compile(
+    r"(?=(?P<kind>일반|청년|신혼|다자녀)[가구용]*[^\n]*전용\s*(?P<min>\d+)[㎡m²]?\s*[~∼～]\s*(?P<max>\d+))"
+)
+_AREA_KIND_KEYS = {"일반": _K_GENERAL, "청년": _K_YOUTH, "신혼": _K_NEWLYWED, "다자녀": _K_MULTI}
+_RE_CONSTRUCTION = re.compile(
+    r"(?=(?P<kind>착공일|사용승인일)[이가]\s*['\"]?(?P<y>\d{2,4})\.(?P<m>\d{1,2})\.(?P<d>\d{1,2}))"
+)
+_CONSTRUCTION_KIND_KEYS = {"착공일": _K_MIN_START, "사용승인일": _K_MIN_APPROVAL}
+# 매입제외 섹션: 시작 표지는 str.find로 찾고 정규식은 종료 표지만 검사
+_EXCLUSION_ANCHOR = "매입제외주택"
+_RE_EXCLUSION_END = re.compile(r"\d+\s*(?:신청접수|매입가격)")
+# 하위 섹션: (원문자 표지, 패턴, 결과 키) — 표지 위치부터 검색 시작
+_EXCLUSION_SUBSECTIONS = (
+    ("①", re.compile(r"①\s*주택\s*지리적[^②③]*", re.DOTALL), "지리적_요건"),
+    ("②", re.compile(r"②\s*주택여건[^③]*", re.DOTALL), "주택_요건"),
+    ("③", re.compile(r"③\s*기타사항.*", re.DOTALL), "기타_요건"),
+)
+# 항목 시작 표지 "(가)" — 본문은 표지 사이를 잘라 얻음 (전방탐색/비탐욕 역추적 없음)
+_RE_ITEM_ANCHOR = re.compile(r"\(([가-힣])\)")
+_RE_WS = re.compile(r"\s+")
+
+# 주택 유형 키워드 → 매입 대상 유형 (결과는 _HOUSING_TYPE_ORDER 순서로 반환)
+_HOUSING_KEYWORDS = {
+    "다가구": _T_MULTI_FAMILY,
+    "다세대": _T_COMMON,
+    "연립": _T_COMMON,
+    "도시형생활주택": _T_URBAN,
+    "오피스텔": _T_OFFICETEL,
+}
+_HOUSING_TYPE_ORDER = (_T_MULTI_FAMILY, _T_COMMON, _T_URBAN, _T_OFFICETEL)
+
+if HAS_AHOCORASICK:
+    # 전체 키워드를 하나의 오토마톤으로 — 텍스트 1회 선형 스캔으로 유형 판정
+    _HOUSING_AC = ahocorasick.Automaton()
+    for _kw, _tag in _HOUSING_KEYWORDS.items():
+        _HOUSING_AC.add_word(_kw, _tag)
+    _HOUSING_AC.make_automaton()
+else:
+    _HOUSING_AC = None
+
+
 @dataclass
 class ParsedAnnouncement:
     """파싱된 공고문 정보"""
@@ -102,12 +178,8 @@ class AnnouncementPDFParser:
     
     def _extract_title(self, text: str) -> Optional[str]:
         """제목 추출"""
-        patterns = [
-            r"(\d{4}년도?\s*\S+지역\s*기존주택\s*매입\s*공고)",
-            r"(\d{4}년\s*\S+\s*기존주택매입공고)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _RE_TITLES:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return None
@@ -115,99 +187,94 @@ class AnnouncementPDFParser:
     def _extract_date(self, text: str, date_type: str) -> Optional[str]:
         """날짜 추출"""
         if date_type == "공고":
-            # 패턴 1: 문서 끝부분의 공고일 (가장 일반적)
-            match = re.search(r"(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.\s*$", text, re.MULTILINE)
+            # 패턴 1: 문서 끝부분의 공고일 (가장 일반적) — 꼬리 구간 우선, 없으면 전체
+            match = _RE_DATE_END.search(text[-_DATE_TAIL_WINDOW:])
+            if not match and len(text) > _DATE_TAIL_WINDOW:
+                match = _RE_DATE_END.search(text)
             if match:
                 return f"{match.group(1)}-{match.group(2).zfill(2)}-{match.group(3).zfill(2)}"
             
             # 패턴 2: "공고일" 명시적 표현
-            match = re.search(r"공고일?\s*[:：]?\s*(\d{4})[.\s]*(\d{1,2})[.\s]*(\d{1,2})", text)
+            match = _RE_DATE_LABELED.search(text)
             if match:
                 return f"{match.group(1)}-{match.group(2).zfill(2)}-{match.group(3).zfill(2)}"
             
             # 패턴 3: 문서 제목/첫부분의 날짜
-            match = re.search(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일", text[:500])
+            match = _RE_DATE_KOREAN.search(text[:500])
             if match:
                 return f"{match.group(1)}-{match.group(2).zfill(2)}-{match.group(3).zfill(2)}"
                 
         elif date_type == "시작":
-            match = re.search(r"신청기간\s*[:：]?\s*(\d{4})\.(\d{1,2})\.(\d{1,2})", text)
+            match = _RE_APPLY_START.search(text)
             if match:
                 return f"{match.group(1)}-{match.group(2).zfill(2)}-{match.group(3).zfill(2)}"
         elif date_type == "마감":
-            match = re.search(r"[~～∼]\s*(\d{4})\.(\d{1,2})\.(\d{1,2})", text)
+            match = _RE_APPLY_END.search(text)
             if match:
                 return f"{match.group(1)}-{match.group(2).zfill(2)}-{match.group(3).zfill(2)}"
         return None
     
     def _extract_housing_types(self, text: str) -> list[str]:
         """매입 대상 주택 유형 추출"""
-        types = []
-        if "다가구" in text:
-            types.append("다가구")
-        if "다세대" in text or "연립" in text:
-            types.append("공동주택")
-        if "도시형생활주택" in text:
-            types.append("도시형생활주택")
-        if "오피스텔" in text:
-            types.append("주거용오피스텔")
-        return types if types else ["다가구", "공동주택", "도시형생활주택", "주거용오피스텔"]
+        if _HOUSING_AC is not None:
+            found = set()
+            for _, tag in _HOUSING_AC.iter(text):
+                found.add(tag)
+                if len(found) == len(_HOUSING_TYPE_ORDER):
+                    break
+        else:
+            # 이미 판정된 유형의 다른 키워드(예: 다세대 발견 시 연립)는 다시 스캔하지 않음
+            found = set()
+            for kw, tag in _HOUSING_KEYWORDS.items():
+                if tag not in found and kw in text:
+                    found.add(tag)
+        types = [t for t in _HOUSING_TYPE_ORDER if t in found]
+        return types if types else list(_HOUSING_TYPE_ORDER)
     
     def _extract_min_units(self, text: str) -> int:
         """최소 호수 추출"""
-        match = re.search(r"(\d+)호\s*이상\s*건물", text)
+        match = _RE_MIN_UNITS.search(text)
         if match:
             return int(match.group(1))
         return 15
     
     def _extract_area_criteria(self, text: str) -> dict:
         """면적 기준 추출"""
-        criteria = {}
-        
-        match = re.search(r"일반[가구용]*[^\n]*전용\s*(\d+)[㎡m²]?\s*[~∼～]\s*(\d+)", text)
-        if match:
-            criteria["일반"] = {"min": int(match.group(1)), "max": int(match.group(2))}
-        
-        match = re.search(r"청년[^\n]*전용\s*(\d+)[㎡m²]?\s*[~∼～]\s*(\d+)", text)
-        if match:
-            criteria["청년"] = {"min": int(match.group(1)), "max": int(match.group(2))}
-        
-        match = re.search(r"신혼[^\n]*전용\s*(\d+)[㎡m²]?\s*[~∼～]\s*(\d+)", text)
-        if match:
-            criteria["신혼신생아"] = {"min": int(match.group(1)), "max": int(match.group(2))}
-        
-        match = re.search(r"다자녀[^\n]*전용\s*(\d+)[㎡m²]?\s*[~∼～]\s*(\d+)", text)
-        if match:
-            criteria["다자녀"] = {"min": int(match.group(1)), "max": int(match.group(2))}
+        found = {}
+        for match in _RE_AREA.finditer(text):
+            kind = match.group("kind")
+            if kind not in found:
+                found[kind] = {"min": int(match.group("min")), "max": int(match.group("max"))}
+                if len(found) == len(_AREA_KIND_KEYS):
+                    break
         
+        # 결과 키 순서는 분류 정의 순서로 고정
+        criteria = {key: found[kind] for kind, key in _AREA_KIND_KEYS.items() if kind in found}
         return criteria if criteria else {
-            "일반": {"min": 20, "max": 85},
-            "청년": {"min": 16, "max": 60},
-            "신혼신생아": {"min": 36, "max": 85},
-            "다자녀": {"min": 46, "max": 85},
+            _K_GENERAL: {"min": 20, "max": 85},
+            _K_YOUTH: {"min": 16, "max": 60},
+            _K_NEWLYWED: {"min": 36, "max": 85},
+            _K_MULTI: {"min": 46, "max": 85},
         }
     
     def _extract_construction_criteria(self, text: str) -> dict:
         """건령 기준 추출"""
-        criteria = {}
-        
-        match = re.search(r"착공일[이가]\s*['\"]?(\d{2,4})\.(\d{1,2})\.(\d{1,2})", text)
-        if match:
-            year = match.group(1)
-            if len(year) == 2:
-                year = "20" + year
-            criteria["min_construction_start"] = f"{year}-{match.group(2).zfill(2)}-{match.group(3).zfill(2)}"
-        
-        match = re.search(r"사용승인일[이가]\s*['\"]?(\d{2,4})\.(\d{1,2})\.(\d{1,2})", text)
-        if match:
-            year = match.group(1)
+        found = {}
+        for match in _RE_CONSTRUCTION.finditer(text):
+            kind = match.group("kind")
+            if kind in found:
+                continue
+            year = match.group("y")
             if len(year) == 2:
                 year = "20" + year
-            criteria["min_approval_date"] = f"{year}-{match.group(2).zfill(2)}-{match.group(3).zfill(2)}"
+            found[kind] = f"{year}-{match.group('m').zfill(2)}-{match.group('d').zfill(2)}"
+            if len(found) == len(_CONSTRUCTION_KIND_KEYS):
+                break
         
+        criteria = {key: found[kind] for kind, key in _CONSTRUCTION_KIND_KEYS.items() if kind in found}
         return criteria if criteria else {
-            "min_construction_start": "2009-01-01",
-            "min_approval_date": "2015-01-01"
+            _K_MIN_START: "2009-01-01",
+            _K_MIN_APPROVAL: "2015-01-01"
         }
     
     def _extract_exclusion_sections(self, text: str) -> dict[str, list[str]]:
@@ -218,40 +285,37 @@ class AnnouncementPDFParser:
             "기타_요건": []
         }
         
-        exclusion_match = re.search(
-            r"매입제외주택(.*?)(?=\d+\s*신청접수|\d+\s*매입가격|$)", 
-            text, 
-            re.DOTALL
-        )
-        
-        if not exclusion_match:
+        start = text.find(_EXCLUSION_ANCHOR)
+        if start < 0:
             return sections
+        start += len(_EXCLUSION_ANCHOR)
         
-        exclusion_text = exclusion_match.group(1)
-        
-        geo_match = re.search(r"①\s*주택\s*지리적[^②③]*", exclusion_text, re.DOTALL)
-        if geo_match:
-            sections["지리적_요건"] = self._split_into_items(geo_match.group(0))
-        
-        housing_match = re.search(r"②\s*주택여건[^③]*", exclusion_text, re.DOTALL)
-        if housing_match:
-            sections["주택_요건"] = self._split_into_items(housing_match.group(0))
+        # 다음 "N 신청접수"/"N 매입가격" 앞까지, 없으면 문서 끝(마지막 개행 제외)까지
+        end_match = _RE_EXCLUSION_END.search(text, start)
+        if end_match:
+            end = end_match.start()
+        else:
+            end = len(text) - 1 if text.endswith("\n") else len(text)
+        exclusion_text = text[start:end]
         
-        other_match = re.search(r"③\s*기타사항.*", exclusion_text, re.DOTALL)
-        if other_match:
-            sections["기타_요건"] = self._split_into_items(other_match.group(0))
+        for marker, pattern, key in _EXCLUSION_SUBSECTIONS:
+            pos = exclusion_text.find(marker)
+            if pos < 0:
+                continue
+            match = pattern.search(exclusion_text, pos)
+            if match:
+                sections[key] = self._split_into_items(match.group(0))
         
         return sections
     
     def _split_into_items(self, text: str) -> list[str]:
         """텍스트를 항목별로 분리"""
         items = []
-        pattern = r"\(([가-힣])\)\s*([^(]*?)(?=\([가-힣]\)|$)"
-        matches = re.findall(pattern, text, re.DOTALL)
+        anchors = [(m.start(), m.end(), m.group(1)) for m in _RE_ITEM_ANCHOR.finditer(text)]
         
-        for label, content in matches:
-            content = content.strip()
-            content = re.sub(r'\s+', ' ', content)
+        for i, (_, end, label) in enumerate(anchors):
+            next_start = anchors[i + 1][0] if i + 1 < len(anchors) else len(text)
+            content = _RE_WS.sub(' ', text[end:next_start].strip())
             if content:
                 items.append(f"({label}) {content}")
         
@@ -281,8 +345,8 @@ class AnnouncementPDFParser:
             application_end=parsed.application_end,
             min_units=parsed.min_units,
             max_exclusive_area=85.0,
-            min_construction_start=parsed.construction_criteria.get("min_construction_start", "2009-01-01"),
-            min_approval_date=parsed.construction_criteria.get("min_approval_date", "2015-01-01"),
+            min_construction_start=parsed.construction_criteria.get(_K_MIN_START, "2009-01-01"),
+            min_approval_date=parsed.construction_criteria.get(_K_MIN_APPROVAL, "2015-01-01"),
             officetel_min_approval=parsed.construction_criteria.get("officetel_min_approval", "2010-01-01"),
             area_by_type=parsed.area_criteria,
             exclusion_rules=rules,
@@ -300,14 +364,14 @@ def extract_text_from_pdf(pdf_path: str) -> str:
         import fitz
         
         doc = fitz.open(pdf_path)
-        text_parts = []
-        
+        # 페이지 텍스트를 버퍼에 바로 기록 (페이지 리스트 보관 + join 복사 생략)
+        buf = io.StringIO()
         for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text_parts.append(page.get_text())
-        
+            if page_num:
+                buf.write("\n")
+            buf.write(doc.load_page(page_num).get_text())
         doc.close()
-        return "\n".join(text_parts)
+        return buf.getvalue()
         
     except ImportError:
         print("PyMuPDF가 설치되지 않았습니다. pip install pymupdf")
@@ -329,7 +393,7 @@ def parse_announcement_pdf(pdf_path: str, region: str = "미지정") -> Announce
     parsed = parser.parse_from_text(text, region)
     config = parser.create_config_from_parsed(parsed, use_default_rules=True)
     
-    manager = AnnouncementConfigManager()
-    manager.save_config(config)
+    # 파서가 이미 가진 설정 관리자 재사용
+    parser.config_manager.save_config(config)
     
     return config
@@ -17,7 +17,8 @@ class GlobalAPIRateLimiter:
     전역 API Rate Limiter (싱글톤) — v2.0 고속 최적화
 
     - Semaphore(MAX_CONCURRENT_CALLS): 동시 API 호출 수 제한
-    - MIN_INTERVAL: 호출 간 최소 간격 (초)
+    - MIN_INTERVAL: 호출 간 최소 간격 (초) — 락 안에서는 호출 시각(슬롯)만 예약하고
+      대기는 락 밖(Condition.wait)에서 수행하므로 대기 중인 쓰레드끼리 서로 막지 않음
     - COOLDOWN: 429 발생 시 전체 쓰레드 일시정지 시간 (초)
     """
 
@@ -34,8 +35,8 @@ class GlobalAPIRateLimiter:
                 if cls._instance is None:
                     inst = super().__new__(cls)
                     inst._semaphore = threading.Semaphore(cls.MAX_CONCURRENT_CALLS)
-                    inst._interval_lock = threading.Lock()
-                    inst._last_call_time = 0.0
+                    inst._cv = threading.Condition()
+                    inst._next_available = 0.0
                     inst._cooldown_until = 0.0
                     cls._instance = inst
         return cls._instance
@@ -44,34 +45,43 @@ class GlobalAPIRateLimiter:
         """API 호출 전 호출 — 동시 호출 수·간격·쿨다운 대기"""
         self._semaphore.acquire()
         try:
-            with self._interval_lock:
-                # 글로벌 쿨다운 대기
+            with self._cv:
                 now = time.monotonic()
                 if now < self._cooldown_until:
                     wait = self._cooldown_until - now
                     print(f"    [GlobalLimiter] 쿨다운 대기 {wait:.1f}초...")
-                    time.sleep(wait)
+                slot = self._reserve_slot(now)
 
-                # 최소 간격 대기
-                now = time.monotonic()
-                elapsed = now - self._last_call_time
-                if elapsed < self.MIN_INTERVAL:
-                    time.sleep(self.MIN_INTERVAL - elapsed)
-
-                self._last_call_time = time.monotonic()
+                while True:
+                    now = time.monotonic()
+                    # 대기 중 429 발생 → 쿨다운 이후 슬롯으로 재예약 (쿨다운 직후 몰림 방지)
+                    if slot < self._cooldown_until:
+                        slot = self._reserve_slot(now)
+                    if now >= slot:
+                        break
+                    # wait()는 락을 놓고 대기 — 다른 쓰레드는 그동안 자기 슬롯 예약 가능
+                    self._cv.wait(slot - now)
         except Exception:
             self._semaphore.release()
             raise
 
+    def _reserve_slot(self, now: float) -> float:
+        """다음 호출 가능 시각 예약 (self._cv 보유 상태에서 호출)"""
+        slot = max(now, self._cooldown_until, self._next_available)
+        self._next_available = slot + self.MIN_INTERVAL
+        return slot
+
     def release(self) -> None:
         """API 응답 수신 후 호출"""
         self._semaphore.release()
 
     def report_rate_limit(self) -> None:
         """429 발생 시 글로벌 쿨다운 설정 — 모든 쓰레드에 영향"""
-        with self._interval_lock:
+        with self._cv:
             self._cooldown_until = time.monotonic() + self.COOLDOWN
             print(f"    [GlobalLimiter] 429 감지 → 전체 {self.COOLDOWN}초 쿨다운 시작")
+            # 대기 중인 쓰레드가 슬롯을 쿨다운 이후로 다시 잡도록 깨움
+            self._cv.notify_all()
 
 
 # 편의를 위한 모듈 레벨 싱글톤 접근
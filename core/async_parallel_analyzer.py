@@ -17,38 +17,113 @@ import hashlib
 import io
 import json
 import os
+import sqlite3
+import tempfile
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple, Any
 from functools import lru_cache
 
-from dotenv import load_dotenv
+if TYPE_CHECKING:
+    from PIL import Image
 
+# Base64 인코더: pybase64(SIMD) 설치 시 사용 — 출력 동일, 없으면 stdlib 폴백
 try:
-    import fitz  # PyMuPDF
-    HAS_PYMUPDF = True
+    import pybase64 as base64
 except ImportError:
-    HAS_PYMUPDF = False
+    import base64
 
+# 캐시 키 해시: xxhash 설치 시 XXH3 (비암호 해시, MD5 대비 수십 배 빠름), 없으면 MD5 폴백
 try:
-    from PIL import Image, ImageEnhance
-    Image.MAX_IMAGE_PIXELS = None
-    HAS_PIL = True
+    import xxhash
+    HAS_XXHASH = True
 except ImportError:
-    HAS_PIL = False
+    HAS_XXHASH = False
 
+# 텍스트 기반 유형 판별: pyahocorasick 설치 시 전체 키워드를 한 번의 스캔으로 매칭
 try:
-    import google.generativeai as genai
-    HAS_GENAI = True
+    import ahocorasick
+    HAS_AHOCORASICK = True
 except ImportError:
-    HAS_GENAI = False
+    HAS_AHOCORASICK = False
 
 from core.data_models import PublicHousingReviewResult, DocumentStatus
 
 
+# =============================================================================
+# 무거운 선택 의존성 지연 로드 (실제 분석 시점에 1회만 import — 모듈 import 비용 절감)
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _fitz():
+    """PyMuPDF 모듈 (미설치 시 None)"""
+    try:
+        import fitz
+    except ImportError:
+        return None
+    return fitz
+
+
+@lru_cache(maxsize=1)
+def _pil():
+    """(Image, ImageFilter, ImageStat) 모듈 (미설치 시 None)"""
+    try:
+        from PIL import Image, ImageFilter, ImageStat
+    except ImportError:
+        return None
+    Image.MAX_IMAGE_PIXELS = None
+    return Image, ImageFilter, ImageStat
+
+
+@lru_cache(maxsize=1)
+def _genai():
+    """google.generativeai 모듈 (미설치 시 None)"""
+    try:
+        import google.generativeai as genai
+    except ImportError:
+        return None
+    return genai
+
+
+@lru_cache(maxsize=1)
+def _google_genai():
+    """Batch API용 google-genai SDK — (genai, types), 미설치 시 None"""
+    try:
+        from google import genai
+        from google.genai import types
+    except ImportError:
+        return None
+    return genai, types
+
+
+@lru_cache(maxsize=1)
+def _httpx():
+    """Gemini REST 직접 호출용 httpx 모듈 (미설치 시 None — SDK 경로 사용)"""
+    try:
+        import httpx
+    except ImportError:
+        return None
+    return httpx
+
+
+@lru_cache(maxsize=1)
+def _turbo_jpeg():
+    """PyTurboJPEG(libjpeg-turbo SIMD) 인코더 — (encoder, numpy, TJPF_RGB, TJSAMP_420), 사용 불가 시 None
+    (Pillow 경로도 pillow-simd 설치 시 코드 변경 없이 가속됨)"""
+    try:
+        import numpy as np
+        from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+        # libturbojpeg 공유 라이브러리 없으면 여기서 실패
+        return TurboJPEG(), np, TJPF_RGB, TJSAMP_420
+    except Exception:
+        return None
+
+
 # =============================================================================
 # 설정
 # =============================================================================
@@ -65,15 +140,25 @@ class AsyncConfig:
     JPEG_QUALITY = 75            # JPEG 압축으로 전송량 감소
     
     # 배치 처리
-    BATCH_SIZE = 10              # 한 번에 분석할 미확인 페이지 수
+    BATCH_SIZE = 10              # 한 요청에 담을 미확인 페이지 최대 수 (배치끼리는 동시 호출)
     
     # 캐싱
     ENABLE_CACHE = True          # 이미지 해시 기반 캐싱
+    IMAGE_CACHE_SIZE = 1024      # 캐시 최대 항목 수 (LRU — 장시간 실행 시 메모리 상한)
+    # 페이지 해시 → 문서 유형 영구 저장 경로 (기본 None = 실행 중 메모리만, 지정 시 실행 간 유지)
+    # 예: os.path.join(os.path.expanduser("~"), ".cache", "with-quasar-oppa", "page_types.sqlite")
+    PAGE_TYPE_CACHE_PATH: Optional[str] = None
     
     # API 설정
-    API_DELAY = 0.1              # API 호출 간 최소 대기 (0.1초)
     MAX_RETRIES = 3              # 재시도 횟수
     
+    HTTP_TIMEOUT = 120.0         # Gemini REST 호출 타임아웃 (초)
+    
+    # Gemini Batch API (비용 50% 절감·높은 한도, 대신 완료 시간 보장 없음 → 기본 비활성)
+    USE_BATCH_API = False        # 유형 판별/이중검증 요청을 배치 작업 1건으로 제출
+    BATCH_POLL_INTERVAL = 10.0   # 작업 상태 확인 간격 (초)
+    BATCH_TIMEOUT = 900.0        # 이 시간 내 미완료 시 취소 후 실시간 호출로 폴백 (초)
+    
     # 이중검증
     DUAL_CHECK_PARALLEL = True   # 1차/2차 병렬 실행
 
@@ -83,55 +168,252 @@ class AsyncConfig:
 # =============================================================================
 
 class ImageHashCache:
-    """이미지 해시 기반 분석 결과 캐싱"""
+    """이미지 해시 기반 분석 결과 캐싱 (최대 IMAGE_CACHE_SIZE개, LRU 제거)"""
     
-    def __init__(self):
-        self._cache: Dict[str, Dict] = {}
+    def __init__(self, maxsize: int = AsyncConfig.IMAGE_CACHE_SIZE,
+                 type_db_path: Optional[str] = None):
+        self._cache: OrderedDict[str, Dict] = OrderedDict()
+        self._maxsize = maxsize
         self._lock = threading.Lock()
+        # 페이지 유형 캐시: 메모리 + sqlite (DB 사용 불가 시 메모리만)
+        self._types: Dict[str, str] = {}
+        self._type_db_path = type_db_path
+        self._type_db: Optional[sqlite3.Connection] = None
+    
+    HASH_SIZE = 64  # 해시용 축소 이미지 최대 변 길이
     
     @staticmethod
     def compute_hash(image: Image.Image) -> str:
         """이미지 해시 계산 (빠른 방식)"""
-        # 작은 크기로 리사이즈 후 해시 (속도 우선)
-        small = image.copy()
-        small.thumbnail((64, 64))
-        buf = io.BytesIO()
-        small.save(buf, format="PNG")
-        return hashlib.md5(buf.getvalue()).hexdigest()
+        # 작은 흑백 이미지의 원시 픽셀을 바로 해시 (복사/PNG 인코딩 생략)
+        Image, _, _ = _pil()
+        w, h = image.size
+        scale = ImageHashCache.HASH_SIZE / max(w, h, 1)
+        small = image
+        if scale < 1:
+            # reducing_gap: 정수배 박스 축소 후 보간 — 800px → 64px 축소가 약 3배 빠름
+            small = image.resize(
+                (max(1, round(w * scale)), max(1, round(h * scale))),
+                Image.Resampling.BILINEAR,
+                reducing_gap=2.0,
+            )
+        small = small.convert("L")
+        hasher = xxhash.xxh3_64() if HAS_XXHASH else hashlib.md5()
+        hasher.update(b"%dx%d:" % small.size)  # 가로/세로가 뒤바뀐 동일 바이트열 구분
+        hasher.update(small.tobytes())
+        return hasher.hexdigest()
     
     def get(self, image_hash: str) -> Optional[Dict]:
         with self._lock:
-            return self._cache.get(image_hash)
+            result = self._cache.get(image_hash)
+            if result is not None:
+                self._cache.move_to_end(image_hash)
+            return result
     
     def set(self, image_hash: str, result: Dict):
         with self._lock:
             self._cache[image_hash] = result
+            self._cache.move_to_end(image_hash)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+    
+    def _type_conn(self) -> Optional[sqlite3.Connection]:
+        """유형 캐시 DB 연결 (지연 생성, 실패 시 이후 메모리만 사용) — self._lock 보유 상태에서 호출"""
+        if self._type_db is None and self._type_db_path:
+            try:
+                os.makedirs(os.path.dirname(self._type_db_path), exist_ok=True)
+                conn = sqlite3.connect(self._type_db_path, check_same_thread=False)
+                conn.execute("CREATE TABLE IF NOT EXISTS page_type_cache (key TEXT PRIMARY KEY, doc_type TEXT NOT NULL)")
+                self._type_db = conn
+            except (OSError, sqlite3.Error):
+                self._type_db_path = None
+        return self._type_db
+    
+    def get_type(self, image_hash: str, namespace: str) -> Optional[str]:
+        """
+        페이지 해시로 이전에 판별된 문서 유형 조회
+        
+        Args:
+            namespace: 판별 조건 식별자 (제공자/모델/프롬프트 버전) — 조건이 바뀌면 이전 결과는 조회되지 않음
+        """
+        if not image_hash:
+            return None
+        key = f"{namespace}:{image_hash}"
+        with self._lock:
+            doc_type = self._types.get(key)
+            if doc_type is None and (conn := self._type_conn()) is not None:
+                try:
+                    row = conn.execute("SELECT doc_type FROM page_type_cache WHERE key = ?", (key,)).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row:
+                    doc_type = self._types[key] = row[0]
+            return doc_type
+    
+    def put_types(self, types: Dict[str, str], namespace: str):
+        """페이지 해시 → 문서 유형 일괄 저장 (namespace는 get_type과 동일)"""
+        types = {f"{namespace}:{h}": t for h, t in types.items() if h}
+        if not types:
+            return
+        with self._lock:
+            self._types.update(types)
+            if (conn := self._type_conn()) is not None:
+                try:
+                    with conn:
+                        conn.executemany("INSERT OR REPLACE INTO page_type_cache VALUES (?, ?)", types.items())
+                except sqlite3.Error:
+                    pass
     
     def clear(self):
         with self._lock:
             self._cache.clear()
+            self._types.clear()
+            if self._type_db is not None:
+                self._type_db.close()
+                self._type_db = None
 
 
 # =============================================================================
 # 비동기 API 클라이언트
 # =============================================================================
 
+_GEMINI_REST_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _has_h2() -> bool:
+    """HTTP/2 지원(h2 패키지) 여부"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    """429/레이트리밋/과부하 오류 여부 (재시도 대기 판단용)"""
+    err_str = str(e).lower()
+    return "429" in err_str or "rate" in err_str or "overload" in err_str
+
+
+def _gemini_rest_text(data: dict) -> str:
+    """Gemini REST 응답에서 첫 번째 텍스트 후보 추출"""
+    for candidate in data.get("candidates") or []:
+        texts = [p.get("text", "") for p in (candidate.get("content") or {}).get("parts") or []]
+        if any(texts):
+            return "".join(texts)
+    return "{}"
+
+
+# AI 유형 판별 대상 문서 유형 (판별 프롬프트의 유형 목록)
+_PAGE_TYPES = (
+    "주택매도신청서", "매도신청주택임대현황", "위임장", "개인정보동의서", "청렴서약서",
+    "공사직원확인서", "인감증명서", "건축물대장표제부", "건축물대장총괄표제부", "건축물대장전유부",
+    "건축물현황도", "토지대장", "토지이용계획확인원", "건물등기부등본", "토지등기부등본",
+    "준공도면", "시험성적서", "납품확인서", "기타",
+)
+_PAGE_TYPE_SET = frozenset(_PAGE_TYPES)
+_PAGE_TYPE_LIST = ", ".join(_PAGE_TYPES)
+# 판별 프롬프트·유형 목록 변경 시 올림 (페이지 유형 캐시의 이전 결과 무효화)
+_IDENTIFY_PROMPT_VERSION = 1
+
+
+# 페이지 보정 커널: 26·(1.5·I − 0.5·SMOOTH) × 대비 1.3 — 중심 (39 − 5)·1.3, 주변 −1·1.3
+_ENHANCE_KERNEL = (-1.3, -1.3, -1.3, -1.3, 44.2, -1.3, -1.3, -1.3, -1.3)
+
+
+# 텍스트 기반 유형 판별 키워드 (keyword, doc_type) — 순서가 우선순위 (구체적인 키워드가 앞)
+_TEXT_KEYWORDS = (
+    ("주택매도신청서", "주택매도신청서"),
+    ("매도신청주택임대현황", "매도신청주택임대현황"),
+    ("임대현황", "매도신청주택임대현황"),
+    ("위임장", "위임장"),
+    ("개인정보동의서", "개인정보동의서"),
+    ("개인정보수집", "개인정보동의서"),
+    ("청렴서약서", "청렴서약서"),
+    ("공사직원확인서", "공사직원확인서"),
+    ("인감증명서", "인감증명서"),
+    ("인감증명", "인감증명서"),
+    ("건축물대장총괄표제부", "건축물대장총괄표제부"),
+    ("총괄표제부", "건축물대장총괄표제부"),
+    ("건축물대장전유부", "건축물대장전유부"),
+    ("전유부", "건축물대장전유부"),
+    ("건축물대장표제부", "건축물대장표제부"),
+    ("건축물대장", "건축물대장표제부"),
+    ("건축물현황도", "건축물현황도"),
+    ("토지이용계획확인원", "토지이용계획확인원"),
+    ("토지이용계획", "토지이용계획확인원"),
+    ("토지대장", "토지대장"),
+    ("토지등기부등본", "토지등기부등본"),
+    ("건물등기부등본", "건물등기부등본"),
+    ("등기사항전부", "건물등기부등본"),
+    ("준공도면", "준공도면"),
+    ("시험성적서", "시험성적서"),
+    ("납품확인서", "납품확인서"),
+)
+
+if HAS_AHOCORASICK:
+    # 값은 _TEXT_KEYWORDS 인덱스 — 매칭 중 가장 작은 인덱스가 순차 검사의 첫 매칭과 동일
+    _TEXT_KEYWORD_AC = ahocorasick.Automaton()
+    for _idx, (_kw, _) in enumerate(_TEXT_KEYWORDS):
+        _TEXT_KEYWORD_AC.add_word(_kw, _idx)
+    _TEXT_KEYWORD_AC.make_automaton()
+else:
+    _TEXT_KEYWORD_AC = None
+
+
+_BATCH_DONE_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED",
+})
+
+
+def _get_http_client():
+    """프로세스 공용 httpx.Client (스레드 안전, TLS/TCP 연결 재사용)"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                # 이중검증 병렬 모드는 1차/2차가 동시에 호출하므로 워커 수의 2배
+                max_conn = AsyncConfig.MAX_API_WORKERS * 2
+                httpx = _httpx()
+                _HTTP_CLIENT = httpx.Client(
+                    http2=_has_h2(),
+                    timeout=AsyncConfig.HTTP_TIMEOUT,
+                    limits=httpx.Limits(max_connections=max_conn, max_keepalive_connections=max_conn),
+                )
+    return _HTTP_CLIENT
+
+
 class AsyncAPIClient:
     """비동기 멀티 API 클라이언트"""
     
     def __init__(self, provider: str = "gemini", model_name: Optional[str] = None):
+        from dotenv import load_dotenv
         load_dotenv()
         self.provider = provider.lower()
         self._lock = threading.Lock()
         self._call_count = 0
+        # async_session() 동안만 유효한 비동기 자원
+        self._async_sem: Optional[asyncio.Semaphore] = None
+        self._async_http = None
+        self._async_client = None
         
         if self.provider == "gemini":
             api_key = os.getenv("GOOGLE_API_KEY")
             if not api_key:
                 raise RuntimeError("GOOGLE_API_KEY 필요")
-            genai.configure(api_key=api_key, transport="rest")
+            self.api_key = api_key
             self.model_name = model_name or "gemini-2.0-flash"
-            self._model = genai.GenerativeModel(self.model_name)
+            if _httpx() is None:
+                # httpx 없으면 SDK(REST) 경로 사용
+                genai = _genai()
+                if genai is None:
+                    raise RuntimeError("google-generativeai 또는 httpx가 필요합니다.")
+                genai.configure(api_key=api_key, transport="rest")
+                self._model = genai.GenerativeModel(self.model_name)
         else:
             # Claude
             from anthropic import Anthropic
@@ -143,19 +425,29 @@ class AsyncAPIClient:
     
     def _pil_to_base64(self, image: Image.Image, fmt: str = "JPEG") -> str:
         """PIL 이미지를 Base64로 변환 (JPEG 압축으로 크기 감소)"""
-        buf = io.BytesIO()
         # RGB 변환 (JPEG는 RGBA 불가)
         if image.mode in ("RGBA", "P"):
             image = image.convert("RGB")
+        turbo = _turbo_jpeg() if fmt == "JPEG" and image.mode == "RGB" else None
+        if turbo is not None:
+            # libjpeg-turbo로 직접 인코딩 (BytesIO + Pillow save 경로 생략)
+            encoder, np, TJPF_RGB, TJSAMP_420 = turbo
+            jpeg = encoder.encode(
+                np.asarray(image),
+                quality=AsyncConfig.JPEG_QUALITY,
+                pixel_format=TJPF_RGB,
+                jpeg_subsample=TJSAMP_420,
+            )
+            return base64.b64encode(jpeg).decode("utf-8")
+        buf = io.BytesIO()
         image.save(buf, format=fmt, quality=AsyncConfig.JPEG_QUALITY)
-        import base64
         return base64.b64encode(buf.getvalue()).decode("utf-8")
     
     def generate_json(self, prompt: str, images: List[Image.Image]) -> str:
         """동기 API 호출 (ThreadPoolExecutor에서 사용)"""
+        # 락은 카운터 갱신에만 사용 (호출 자체는 직렬화하지 않음 — 429는 아래 재시도 백오프로 처리)
         with self._lock:
             self._call_count += 1
-            time.sleep(AsyncConfig.API_DELAY)  # Rate limit 방지
         
         for attempt in range(AsyncConfig.MAX_RETRIES):
             try:
@@ -164,8 +456,7 @@ class AsyncAPIClient:
                 else:
                     return self._call_claude(prompt, images)
             except Exception as e:
-                err_str = str(e).lower()
-                if "429" in err_str or "rate" in err_str or "overload" in err_str:
+                if _is_rate_limit_error(e):
                     wait = (attempt + 1) * 2
                     print(f"[Rate limit] {wait}초 대기 후 재시도...")
                     time.sleep(wait)
@@ -175,8 +466,87 @@ class AsyncAPIClient:
                     time.sleep(1)
         return "{}"
     
+    @asynccontextmanager
+    async def async_session(self):
+        """비동기 호출 세션 — 이벤트 루프에 묶인 동시 호출 제한/HTTP 클라이언트를 열고 닫음"""
+        self._async_sem = asyncio.Semaphore(AsyncConfig.MAX_API_WORKERS)
+        self._async_http = None
+        self._async_client = None
+        try:
+            if self.provider == "gemini":
+                httpx = _httpx()
+                if httpx is not None:
+                    max_conn = AsyncConfig.MAX_API_WORKERS
+                    self._async_http = httpx.AsyncClient(
+                        http2=_has_h2(),
+                        timeout=AsyncConfig.HTTP_TIMEOUT,
+                        limits=httpx.Limits(max_connections=max_conn, max_keepalive_connections=max_conn),
+                    )
+            else:
+                from anthropic import AsyncAnthropic
+                self._async_client = AsyncAnthropic(api_key=self.api_key)
+            yield self
+        finally:
+            if self._async_http is not None:
+                await self._async_http.aclose()
+            if self._async_client is not None:
+                await self._async_client.close()
+            self._async_http = self._async_client = None
+    
+    async def agenerate_json(self, prompt: str, images: List[Image.Image]) -> str:
+        """비동기 API 호출 (async_session 안에서 사용, 동시 호출 수는 세마포어로 제한)"""
+        with self._lock:
+            self._call_count += 1
+        
+        async with self._async_sem:
+            for attempt in range(AsyncConfig.MAX_RETRIES):
+                try:
+                    if self.provider == "gemini":
+                        return await self._acall_gemini(prompt, images)
+                    else:
+                        return await self._acall_claude(prompt, images)
+                except Exception as e:
+                    if _is_rate_limit_error(e):
+                        wait = (attempt + 1) * 2
+                        print(f"[Rate limit] {wait}초 대기 후 재시도...")
+                        await asyncio.sleep(wait)
+                    else:
+                        if attempt == AsyncConfig.MAX_RETRIES - 1:
+                            raise
+                        await asyncio.sleep(1)
+        return "{}"
+    
+    async def _acall_gemini(self, prompt: str, images: List[Image.Image]) -> str:
+        """Gemini 비동기 호출 (httpx 없으면 SDK 호출을 스레드로 위임)"""
+        if self._async_http is None:
+            return await asyncio.to_thread(self._call_gemini, prompt, images)
+        # JPEG/Base64 인코딩은 CPU 작업 — 이벤트 루프를 막지 않도록 스레드에서 수행
+        body = await asyncio.to_thread(self._gemini_rest_body, prompt, images)
+        response = await self._async_http.post(
+            _GEMINI_REST_URL.format(model=self.model_name),
+            headers={"x-goog-api-key": self.api_key},
+            json=body,
+        )
+        response.raise_for_status()
+        return _gemini_rest_text(response.json())
+    
+    async def _acall_claude(self, prompt: str, images: List[Image.Image]) -> str:
+        """Claude 비동기 호출"""
+        content = await asyncio.to_thread(self._claude_content, prompt, images)
+        response = await self._async_client.messages.create(
+            model=self.model_name,
+            max_tokens=8192,
+            messages=[{"role": "user", "content": content}],
+        )
+        if response.content:
+            return getattr(response.content[0], "text", "") or ""
+        return "{}"
+    
     def _call_gemini(self, prompt: str, images: List[Image.Image]) -> str:
         """Gemini API 호출"""
+        if _httpx() is not None:
+            return self._call_gemini_rest(prompt, images)
+        genai = _genai()
         content = [prompt] + (images or [])
         config = genai.types.GenerationConfig(
             response_mime_type="application/json",
@@ -185,8 +555,35 @@ class AsyncAPIClient:
         response = self._model.generate_content(content, generation_config=config)
         return getattr(response, "text", str(response))
     
-    def _call_claude(self, prompt: str, images: List[Image.Image]) -> str:
-        """Claude API 호출"""
+    def _gemini_rest_body(self, prompt: str, images: List[Image.Image]) -> dict:
+        """Gemini REST 요청 본문 (이미지는 인라인 JPEG)"""
+        parts = [{"text": prompt}]
+        for img in images or []:
+            parts.append({
+                "inline_data": {"mime_type": "image/jpeg", "data": self._pil_to_base64(img)},
+            })
+        return {
+            "contents": [{"role": "user", "parts": parts}],
+            "generationConfig": {
+                "responseMimeType": "application/json",
+                "temperature": 0.1,
+            },
+        }
+    
+    def _call_gemini_rest(self, prompt: str, images: List[Image.Image]) -> str:
+        """Gemini REST 엔드포인트 직접 호출 (공용 연결 풀 사용)"""
+        body = self._gemini_rest_body(prompt, images)
+        response = _get_http_client().post(
+            _GEMINI_REST_URL.format(model=self.model_name),
+            headers={"x-goog-api-key": self.api_key},
+            json=body,
+        )
+        # 429 등은 예외 메시지에 상태 코드가 포함되어 generate_json 재시도 로직이 그대로 동작
+        response.raise_for_status()
+        return _gemini_rest_text(response.json())
+    
+    def _claude_content(self, prompt: str, images: List[Image.Image]) -> List[dict]:
+        """Claude 메시지 content 블록 (이미지는 Base64 JPEG)"""
         content = [{"type": "text", "text": prompt}]
         for img in images or []:
             b64 = self._pil_to_base64(img)
@@ -199,6 +596,11 @@ class AsyncAPIClient:
                         "data": b64,
                     },
                 })
+        return content
+    
+    def _call_claude(self, prompt: str, images: List[Image.Image]) -> str:
+        """Claude API 호출"""
+        content = self._claude_content(prompt, images)
         response = self.client.messages.create(
             model=self.model_name,
             max_tokens=8192,
@@ -208,6 +610,67 @@ class AsyncAPIClient:
             return getattr(response.content[0], "text", "") or ""
         return "{}"
     
+    def submit_batch_job(self, jobs: List[Tuple[str, str, List[Image.Image]]]) -> Optional[Dict[str, str]]:
+        """
+        Gemini Batch API로 (key, prompt, images) 요청들을 한 번에 제출하고 완료까지 대기
+        
+        Returns:
+            key → 응답 텍스트 (실패/시간초과/미지원 시 None — 호출부에서 실시간 호출로 폴백)
+        """
+        sdk = _google_genai()
+        if self.provider != "gemini" or sdk is None or not jobs:
+            return None
+        genai, types = sdk
+        
+        try:
+            client = genai.Client(api_key=self.api_key)
+            with self._lock:
+                self._call_count += len(jobs)
+            
+            # 요청 JSONL 작성 → 업로드 (요청 본문은 REST generateContent와 동일)
+            fd, path = tempfile.mkstemp(suffix=".jsonl")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    for key, prompt, images in jobs:
+                        line = {"key": key, "request": self._gemini_rest_body(prompt, images)}
+                        f.write(json.dumps(line, ensure_ascii=False))
+                        f.write("\n")
+                uploaded = client.files.upload(
+                    file=path,
+                    config=types.UploadFileConfig(display_name="with-quasar-oppa-batch", mime_type="jsonl"),
+                )
+            finally:
+                os.remove(path)
+            
+            job = client.batches.create(model=self.model_name, src=uploaded.name)
+            print(f"    [Batch] 작업 제출: {job.name} ({len(jobs)}건)")
+            
+            deadline = time.monotonic() + AsyncConfig.BATCH_TIMEOUT
+            while job.state.name not in _BATCH_DONE_STATES:
+                if time.monotonic() > deadline:
+                    client.batches.cancel(name=job.name)
+                    print(f"    [Batch] {AsyncConfig.BATCH_TIMEOUT:.0f}초 내 미완료 → 취소")
+                    return None
+                time.sleep(AsyncConfig.BATCH_POLL_INTERVAL)
+                job = client.batches.get(name=job.name)
+            
+            if job.state.name != "JOB_STATE_SUCCEEDED" or not (job.dest and job.dest.file_name):
+                print(f"    [Batch] 작업 실패: {job.state.name}")
+                return None
+            
+            results = {}
+            content = client.files.download(file=job.dest.file_name)
+            for line in content.decode("utf-8").splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if "response" in item:
+                    results[item["key"]] = _gemini_rest_text(item["response"])
+            return results
+        except Exception as e:
+            print(f"    [Batch] 오류: {e}")
+            return None
+    
     @property
     def call_count(self) -> int:
         return self._call_count
@@ -258,8 +721,25 @@ class AsyncParallelAnalyzer:
         self.model_name = model_name
         self.dual_check = dual_check
         self._api_client = AsyncAPIClient(provider, model_name)
-        self._cache = ImageHashCache()
-        self._executor = ThreadPoolExecutor(max_workers=AsyncConfig.MAX_API_WORKERS)
+        self._cache = ImageHashCache(type_db_path=AsyncConfig.PAGE_TYPE_CACHE_PATH)
+        # 페이지 유형 캐시 구분자: 제공자·모델·판별 프롬프트가 바뀌면 이전 판별 결과를 재사용하지 않음
+        self._type_namespace = (
+            f"{self._api_client.provider}/{self._api_client.model_name}/v{_IDENTIFY_PROMPT_VERSION}"
+        )
+    
+    def _run_async(self, make_coros) -> list:
+        """API 코루틴들을 하나의 이벤트 루프에서 동시 실행 (입력 순서대로 결과/예외 반환)"""
+        async def runner():
+            async with self._api_client.async_session():
+                return await asyncio.gather(*make_coros(), return_exceptions=True)
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(runner())
+        # 이미 이벤트 루프가 도는 스레드에서 호출된 경우 별도 스레드의 루프에서 실행
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, runner()).result()
     
     def analyze(
         self,
@@ -323,41 +803,41 @@ class AsyncParallelAnalyzer:
     
     def _extract_pages_parallel(self, pdf_path: str) -> List[PageData]:
         """PDF 페이지 병렬 추출"""
-        if not HAS_PYMUPDF:
+        fitz = _fitz()
+        if fitz is None:
             raise RuntimeError("PyMuPDF가 필요합니다.")
+        pil = _pil()
+        if pil is None:
+            raise RuntimeError("Pillow가 필요합니다.")
+        Image, ImageFilter, ImageStat = pil
         
-        doc = fitz.open(pdf_path)
-        total_pages = min(len(doc), 50)
-        
-        # 먼저 모든 페이지 데이터 추출 (fitz는 단일 스레드)
+        # 먼저 모든 페이지 렌더링 (fitz는 단일 스레드 — 50쪽 이하는 프로세스 기동 비용이 렌더링보다 큼)
         raw_pages = []
-        for i in range(total_pages):
-            page = doc.load_page(i)
-            text = page.get_text("text")
-            mat = fitz.Matrix(AsyncConfig.DPI / 72, AsyncConfig.DPI / 72)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            img_bytes = pix.tobytes("png")
-            raw_pages.append((i + 1, img_bytes, text))
-        doc.close()
+        with fitz.open(pdf_path) as doc:
+            for i in range(min(len(doc), 50)):
+                page = doc.load_page(i)
+                text = page.get_text("text")
+                # 목표 크기로 바로 렌더링 (DPI 렌더 후 축소하면 버릴 픽셀까지 래스터화함)
+                rect = page.rect
+                scale = min(AsyncConfig.DPI / 72, AsyncConfig.MAX_IMAGE_PX / max(rect.width, rect.height))
+                pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+                # 원시 RGB 샘플 그대로 전달 (PNG 인코딩 → 디코딩 왕복 생략)
+                raw_pages.append((i + 1, (pix.width, pix.height), pix.samples, text))
         
         # 이미지 처리 병렬화
         def process_page(data):
-            page_num, img_bytes, text = data
-            image = Image.open(io.BytesIO(img_bytes))
-            
-            # 리사이즈
-            w, h = image.size
-            if max(w, h) > AsyncConfig.MAX_IMAGE_PX:
-                scale = AsyncConfig.MAX_IMAGE_PX / max(w, h)
-                image = image.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
-            
-            # RGB 변환
-            if image.mode != "RGB":
-                image = image.convert("RGB")
+            page_num, size, samples, text = data
+            image = Image.frombytes("RGB", size, samples)
             
-            # 대비/선명도
-            image = ImageEnhance.Contrast(image).enhance(1.3)
-            image = ImageEnhance.Sharpness(image).enhance(1.5)
+            # 대비 1.3 + 선명도 1.5를 3x3 커널 1회로 처리 (ImageEnhance 2회 = 전체 이미지 2번 복사·순회)
+            # 선명도: 1.5·x − 0.5·SMOOTH(x), SMOOTH = [[1,1,1],[1,5,1],[1,1,1]]/13
+            # 대비: 1.3·x − 0.3·mean (mean = 회색조 평균, ImageEnhance.Contrast와 동일 기준)
+            # 2단계 방식은 대비 결과를 0~255로 자른 뒤 선명화하므로 글자 경계에서 값이 다름
+            # (텍스트 페이지 기준 픽셀 약 3%, 최대 6단계 @566x800 / 18단계 @827x1170) — 속도 대비 허용한 차이
+            mean = int(ImageStat.Stat(image.convert("L")).mean[0] + 0.5)
+            image = image.filter(ImageFilter.Kernel(
+                (3, 3), _ENHANCE_KERNEL, scale=26, offset=-0.3 * mean,
+            ))
             
             # 해시 계산
             img_hash = self._cache.compute_hash(image) if AsyncConfig.ENABLE_CACHE else ""
@@ -374,28 +854,55 @@ class AsyncParallelAnalyzer:
         """페이지 유형 배치 판별"""
         page_types = {}
         
-        # 텍스트 기반 1차 판별
+        # 텍스트 기반 1차 판별 → 이전에 판별한 동일 페이지(해시) 재사용
         unknown_pages = []
+        duplicates: Dict[str, List[PageData]] = {}
         for page in pages:
             doc_type = self._detect_by_text(page.text)
             if doc_type != "미확인":
                 page_types[page.page_num] = doc_type
                 print(f"    페이지 {page.page_num}: {doc_type} (텍스트)")
+                continue
+            cached = self._cache.get_type(page.image_hash, self._type_namespace)
+            if cached in _PAGE_TYPE_SET:
+                page_types[page.page_num] = cached
+                print(f"    페이지 {page.page_num}: {cached} (캐시)")
+            elif page.image_hash in duplicates:
+                # 같은 PDF 안의 동일 페이지는 대표 1장만 AI에 전송
+                duplicates[page.image_hash].append(page)
             else:
+                if page.image_hash:
+                    duplicates[page.image_hash] = []
                 unknown_pages.append(page)
         
         # 미확인 페이지 배치 AI 판별
         if unknown_pages:
             print(f"    미확인 페이지 {len(unknown_pages)}장 AI 배치 분석...")
             
-            # 배치로 처리
-            for i in range(0, len(unknown_pages), AsyncConfig.BATCH_SIZE):
-                batch = unknown_pages[i:i + AsyncConfig.BATCH_SIZE]
-                batch_results = self._identify_batch_ai(batch)
-                
+            # 배치 수는 유지하되 크기를 고르게 분배 (예: 11장 → 10+1 대신 6+5)
+            n = len(unknown_pages)
+            n_batches = -(-n // AsyncConfig.BATCH_SIZE)
+            size = -(-n // n_batches)
+            batches = [unknown_pages[i:i + size] for i in range(0, n, size)]
+            
+            all_results = self._identify_batches_via_batch_api(batches)
+            if all_results is None:
+                # 배치별 요청을 동시에 실행 (요청당 고정 지연을 배치 수만큼 겹침)
+                all_results = self._run_async(lambda: [self._identify_batch_ai(b) for b in batches])
+            learned = {}
+            for batch, batch_results in zip(batches, all_results):
+                if isinstance(batch_results, BaseException):
+                    batch_results = ["기타"] * len(batch)
                 for page, doc_type in zip(batch, batch_results):
                     page_types[page.page_num] = doc_type
                     print(f"    페이지 {page.page_num}: {doc_type} (AI)")
+                    for dup in duplicates.get(page.image_hash, ()):
+                        page_types[dup.page_num] = doc_type
+                        print(f"    페이지 {dup.page_num}: {doc_type} (페이지 {page.page_num}과 동일)")
+                    # 유형 목록에 있는 값만 저장 ("기타"는 판별 실패 폴백일 수 있으므로 제외)
+                    if doc_type in _PAGE_TYPE_SET and doc_type != "기타":
+                        learned[page.image_hash] = doc_type
+            self._cache.put_types(learned, self._type_namespace)
         
         return page_types
     
@@ -408,65 +915,81 @@ class AsyncParallelAnalyzer:
         if len(normalized) < 30:
             return "미확인"
         
-        # 키워드 매칭
-        keywords = [
-            ("주택매도신청서", "주택매도신청서"),
-            ("매도신청주택임대현황", "매도신청주택임대현황"),
-            ("임대현황", "매도신청주택임대현황"),
-            ("위임장", "위임장"),
-            ("개인정보동의서", "개인정보동의서"),
-            ("개인정보수집", "개인정보동의서"),
-            ("청렴서약서", "청렴서약서"),
-            ("공사직원확인서", "공사직원확인서"),
-            ("인감증명서", "인감증명서"),
-            ("인감증명", "인감증명서"),
-            ("건축물대장총괄표제부", "건축물대장총괄표제부"),
-            ("총괄표제부", "건축물대장총괄표제부"),
-            ("건축물대장전유부", "건축물대장전유부"),
-            ("전유부", "건축물대장전유부"),
-            ("건축물대장표제부", "건축물대장표제부"),
-            ("건축물대장", "건축물대장표제부"),
-            ("건축물현황도", "건축물현황도"),
-            ("토지이용계획확인원", "토지이용계획확인원"),
-            ("토지이용계획", "토지이용계획확인원"),
-            ("토지대장", "토지대장"),
-            ("토지등기부등본", "토지등기부등본"),
-            ("건물등기부등본", "건물등기부등본"),
-            ("등기사항전부", "건물등기부등본"),
-            ("준공도면", "준공도면"),
-            ("시험성적서", "시험성적서"),
-            ("납품확인서", "납품확인서"),
-        ]
+        # 키워드 매칭 — 여러 키워드가 있으면 목록 앞쪽(더 구체적인) 키워드 우선
+        if _TEXT_KEYWORD_AC is not None:
+            best = len(_TEXT_KEYWORDS)
+            for _, idx in _TEXT_KEYWORD_AC.iter(normalized):
+                if idx < best:
+                    best = idx
+                    if idx == 0:
+                        break
+            if best < len(_TEXT_KEYWORDS):
+                return _TEXT_KEYWORDS[best][1]
+            return "미확인"
         
-        for keyword, doc_type in keywords:
+        for keyword, doc_type in _TEXT_KEYWORDS:
             if keyword in normalized:
                 return doc_type
         
         return "미확인"
     
-    def _identify_batch_ai(self, pages: List[PageData]) -> List[str]:
-        """AI로 배치 유형 판별"""
-        if not pages:
-            return []
-        
-        prompt = f"""다음 {len(pages)}개 이미지의 문서 유형을 순서대로 판별하세요.
+    def _use_batch_api(self) -> bool:
+        """Gemini Batch API 사용 여부"""
+        return AsyncConfig.USE_BATCH_API and self._api_client.provider == "gemini"
+    
+    def _identify_batches_via_batch_api(self, batches: List[List[PageData]]) -> Optional[List[List[str]]]:
+        """유형 판별 배치들을 Batch API 작업 1건으로 처리 (미사용/실패 시 None)"""
+        if not self._use_batch_api():
+            return None
+        jobs = [
+            (f"id:{i}", self._identify_prompt(len(batch)), [p.image for p in batch])
+            for i, batch in enumerate(batches)
+        ]
+        responses = self._api_client.submit_batch_job(jobs)
+        if responses is None:
+            return None
+        return [
+            self._parse_identify_response(responses.get(f"id:{i}"), len(batch))
+            for i, batch in enumerate(batches)
+        ]
+    
+    @staticmethod
+    def _identify_prompt(n: int) -> str:
+        """유형 판별 프롬프트"""
+        return f"""다음 {n}개 이미지의 문서 유형을 순서대로 판별하세요.
 
-[유형 목록] 주택매도신청서, 매도신청주택임대현황, 위임장, 개인정보동의서, 청렴서약서, 공사직원확인서, 인감증명서, 건축물대장표제부, 건축물대장총괄표제부, 건축물대장전유부, 건축물현황도, 토지대장, 토지이용계획확인원, 건물등기부등본, 토지등기부등본, 준공도면, 시험성적서, 납품확인서, 기타
+[유형 목록] {_PAGE_TYPE_LIST}
 
 출력 (JSON 배열만):
 ["유형1", "유형2", ...]"""
+    
+    @staticmethod
+    def _parse_identify_response(response: Optional[str], n: int) -> List[str]:
+        """유형 판별 응답 → 페이지 수만큼의 유형 목록 (파싱 실패 시 "기타")"""
+        try:
+            result = json.loads(response) if response else None
+            if isinstance(result, list):
+                # 응답 배열이 짧으면 나머지 페이지는 "기타"로 채움
+                result = [str(t) for t in result[:n]]
+                return result + ["기타"] * (n - len(result))
+        except Exception as e:
+            print(f"    배치 AI 판별 오류: {e}")
+        return ["기타"] * n
+    
+    async def _identify_batch_ai(self, pages: List[PageData]) -> List[str]:
+        """AI로 배치 유형 판별"""
+        if not pages:
+            return []
         
+        prompt = self._identify_prompt(len(pages))
         images = [p.image for p in pages]
         
         try:
-            response = self._api_client.generate_json(prompt, images)
-            result = json.loads(response)
-            if isinstance(result, list):
-                return result[:len(pages)]
+            response = await self._api_client.agenerate_json(prompt, images)
         except Exception as e:
             print(f"    배치 AI 판별 오류: {e}")
-        
-        return ["기타"] * len(pages)
+            return ["기타"] * len(pages)
+        return self._parse_identify_response(response, len(pages))
     
     def _analyze_dual_parallel(
         self,
@@ -498,49 +1021,80 @@ class AsyncParallelAnalyzer:
         all_tasks = tasks_first + tasks_second
         print(f"    총 {len(all_tasks)}개 분석 작업 동시 실행...")
         
-        def analyze_task(task):
+        results_first = {}
+        results_second = {}
+        
+        # Batch API: 1차/2차 전체를 작업 1건으로 제출
+        if self._use_batch_api():
+            jobs = [
+                (f"{pass_num}:{doc_type}",
+                 self._get_analysis_prompt(doc_type, ann_date, pass_num),
+                 [p.image for p in doc_pages[:5]])
+                for doc_type, doc_pages, ann_date, pass_num in all_tasks
+            ]
+            responses = self._api_client.submit_batch_job(jobs)
+            if responses is not None:
+                for (doc_type, doc_pages, _, pass_num), (key, _, _) in zip(all_tasks, jobs):
+                    result = self._to_document_result(doc_type, doc_pages, pass_num, responses.get(key))
+                    (results_first if pass_num == "1차" else results_second)[doc_type] = result
+                return list(results_first.values()), list(results_second.values())
+        
+        async def analyze_task(task):
             doc_type, doc_pages, ann_date, pass_num = task
             images = [p.image for p in doc_pages[:5]]
             prompt = self._get_analysis_prompt(doc_type, ann_date, pass_num)
             
             try:
-                response = self._api_client.generate_json(prompt, images)
-                data = json.loads(response) if response else {}
-                # data가 리스트인 경우 첫 번째 요소 사용 또는 빈 dict
-                if isinstance(data, list):
-                    data = data[0] if data and isinstance(data[0], dict) else {}
-                # data가 dict가 아닌 경우 빈 dict
-                if not isinstance(data, dict):
-                    data = {}
-                return (doc_type, pass_num, DocumentResult(
-                    doc_type=doc_type,
-                    pages=[p.page_num for p in doc_pages],
-                    data=data,
-                    confidence=0.85
-                ))
+                response = await self._api_client.agenerate_json(prompt, images)
             except Exception as e:
-                print(f"      [{pass_num}] {doc_type} 오류: {e}")
-                return (doc_type, pass_num, DocumentResult(doc_type=doc_type, pages=[], data={}, confidence=0.5))
+                response = e
+            return (doc_type, pass_num, self._to_document_result(doc_type, doc_pages, pass_num, response))
         
         # 병렬 실행
-        results_first = {}
-        results_second = {}
         
-        futures = {self._executor.submit(analyze_task, t): t for t in all_tasks}
-        for future in as_completed(futures):
-            task = futures[future]
-            try:
-                doc_type, pass_num, result = future.result()
-                if pass_num == "1차":
-                    results_first[doc_type] = result
-                else:
-                    results_second[doc_type] = result
-                print(f"      ✓ [{pass_num}] {doc_type} 완료")
-            except Exception as e:
-                print(f"      ✗ {task[0]} 예외: {e}")
+        async def run_task(task):
+            doc_type, pass_num, result = await analyze_task(task)
+            print(f"      ✓ [{pass_num}] {doc_type} 완료")
+            return doc_type, pass_num, result
+        
+        outcomes = self._run_async(lambda: [run_task(t) for t in all_tasks])
+        for task, outcome in zip(all_tasks, outcomes):
+            if isinstance(outcome, BaseException):
+                print(f"      ✗ {task[0]} 예외: {outcome}")
+                continue
+            doc_type, pass_num, result = outcome
+            if pass_num == "1차":
+                results_first[doc_type] = result
+            else:
+                results_second[doc_type] = result
         
         return list(results_first.values()), list(results_second.values())
     
+    @staticmethod
+    def _to_document_result(doc_type: str, doc_pages: List[PageData], pass_num: str, response) -> DocumentResult:
+        """분석 응답(텍스트, 또는 호출 실패 시 예외/None) → DocumentResult"""
+        try:
+            if isinstance(response, BaseException):
+                raise response
+            if response is None:
+                raise RuntimeError("응답 없음")
+            data = json.loads(response) if response else {}
+            # data가 리스트인 경우 첫 번째 요소 사용 또는 빈 dict
+            if isinstance(data, list):
+                data = data[0] if data and isinstance(data[0], dict) else {}
+            # data가 dict가 아닌 경우 빈 dict
+            if not isinstance(data, dict):
+                data = {}
+            return DocumentResult(
+                doc_type=doc_type,
+                pages=[p.page_num for p in doc_pages],
+                data=data,
+                confidence=0.85
+            )
+        except Exception as e:
+            print(f"      [{pass_num}] {doc_type} 오류: {e}")
+            return DocumentResult(doc_type=doc_type, pages=[], data={}, confidence=0.5)
+    
     def _merge_dual_results(
         self,
         first: List[DocumentResult],
@@ -587,13 +1141,13 @@ class AsyncParallelAnalyzer:
         
         print(f"    {len(tasks)}개 문서 유형 동시 분석...")
         
-        def analyze_task(task):
+        async def analyze_task(task):
             doc_type, doc_pages, ann_date = task
             images = [p.image for p in doc_pages[:5]]
             prompt = self._get_analysis_prompt(doc_type, ann_date, "1차")
             
             try:
-                response = self._api_client.generate_json(prompt, images)
+                response = await self._api_client.agenerate_json(prompt, images)
                 data = json.loads(response) if response else {}
                 # data가 리스트인 경우 첫 번째 요소 사용 또는 빈 dict
                 if isinstance(data, list):
@@ -612,15 +1166,17 @@ class AsyncParallelAnalyzer:
                 return DocumentResult(doc_type=doc_type, pages=[], data={}, confidence=0.5)
         
         # 병렬 실행
+        async def run_task(task):
+            result = await analyze_task(task)
+            print(f"      ✓ {result.doc_type} 완료 (페이지 {result.pages})")
+            return result
+        
         results = []
-        futures = {self._executor.submit(analyze_task, t): t for t in tasks}
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                results.append(result)
-                print(f"      ✓ {result.doc_type} 완료 (페이지 {result.pages})")
-            except Exception as e:
-                print(f"      예외: {e}")
+        for outcome in self._run_async(lambda: [run_task(t) for t in tasks]):
+            if isinstance(outcome, BaseException):
+                print(f"      예외: {outcome}")
+                continue
+            results.append(outcome)
         
         return results
     
@@ -752,7 +1308,6 @@ class AsyncParallelAnalyzer:
     
     def close(self):
         """리소스 정리"""
-        self._executor.shutdown(wait=False)
         self._cache.clear()
 
 
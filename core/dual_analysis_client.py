@@ -414,10 +414,10 @@ JSON만 출력하세요."""
             "inconsistencies": inconsistencies,
             "validation_report": validator.generate_report(),
             "confidence_summary": {
-                "high": sum(1 for r in validator.dual_results if r.confidence == ConfidenceLevel.HIGH),
-                "medium": sum(1 for r in validator.dual_results if r.confidence == ConfidenceLevel.MEDIUM),
-                "low": sum(1 for r in validator.dual_results if r.confidence == ConfidenceLevel.LOW),
-                "manual_check": sum(1 for r in validator.dual_results if r.confidence == ConfidenceLevel.MANUAL_CHECK),
+                "high": sum(1 for r in validator.dual_results if r.confidence is ConfidenceLevel.HIGH),
+                "medium": sum(1 for r in validator.dual_results if r.confidence is ConfidenceLevel.MEDIUM),
+                "low": sum(1 for r in validator.dual_results if r.confidence is ConfidenceLevel.LOW),
+                "manual_check": sum(1 for r in validator.dual_results if r.confidence is ConfidenceLevel.MANUAL_CHECK),
             }
         }
         
@@ -22,6 +22,15 @@ from core.data_models import (
 )
 
 
+# 작성일·발급일 파싱 포맷 (호출마다 리스트를 새로 만들지 않도록 모듈 상수로 유지)
+_DATE_FMTS = ("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d")
+
+# 사용승인일 파싱 포맷 (_DATE_FMTS + 공백·2자리 연도·한글 표기)
+_APPROVAL_DATE_FMTS = _DATE_FMTS + (
+    "%Y. %m. %d", "%y-%m-%d", "%y.%m.%d", "%Y년 %m월 %d일", "%Y년%m월%d일",
+)
+
+
 @dataclass
 class EnhancedSupplementaryDocument:
     """강화된 보완서류 항목"""
@@ -80,7 +89,7 @@ class EnhancedValidator:
         
         try:
             # 다양한 날짜 형식 파싱
-            for fmt in ["%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d"]:
+            for fmt in _DATE_FMTS:
                 try:
                     doc_date = datetime.strptime(date_str, fmt).date()
                     if doc_date >= self.announcement_date:
@@ -101,8 +110,7 @@ class EnhancedValidator:
         raw = s.strip()
         if not raw:
             return None
-        for fmt in ("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d", "%Y. %m. %d", "%y-%m-%d", "%y.%m.%d",
-                    "%Y년 %m월 %d일", "%Y년%m월%d일"):
+        for fmt in _APPROVAL_DATE_FMTS:
             try:
                 d = datetime.strptime(raw[:24].strip(), fmt)
                 return (d.year, d.month, d.day)
@@ -0,0 +1,14 @@
+"""
+JSON 디코딩 공용 헬퍼
+
+- orjson 설치 시 사용 (stdlib json보다 3~5배 빠름), 없으면 stdlib 폴백
+- 두 디코더 모두 실패 시 ValueError 하위 예외 (json.JSONDecodeError / orjson.JSONDecodeError)
+"""
+from __future__ import annotations
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+__all__ = ["json_loads"]
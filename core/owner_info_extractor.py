@@ -42,6 +42,7 @@ except ImportError:
     HAS_CV2 = False
 
 from dotenv import load_dotenv
+from core.json_utils import json_loads as _json_loads
 from core.vision_client import create_vision_client
 
 
@@ -305,7 +306,7 @@ class OwnerInfoExtractor:
         arr_match = re.search(r'\[[\s\S]*\]', text)
         if arr_match:
             try:
-                arr = json.loads(arr_match.group())
+                arr = _json_loads(arr_match.group())
                 if arr and isinstance(arr, list) and len(arr) > 0:
                     return arr[0] if isinstance(arr[0], dict) else {}
             except json.JSONDecodeError:
@@ -315,7 +316,7 @@ class OwnerInfoExtractor:
         obj_match = re.search(r'\{[\s\S]*\}', text)
         if obj_match:
             try:
-                return json.loads(obj_match.group())
+                return _json_loads(obj_match.group())
             except json.JSONDecodeError:
                 pass
         
@@ -690,7 +691,7 @@ class SealComparator:
         match = re.search(r'\{[\s\S]*\}', text)
         if match:
             try:
-                return json.loads(match.group())
+                return _json_loads(match.group())
             except json.JSONDecodeError:
                 pass
         
@@ -48,6 +48,7 @@ try:
 except ImportError:
     HAS_CV2 = False
 
+from core.json_utils import json_loads as _json_loads
 from core.data_models import (
     PublicHousingReviewResult,
     DocumentStatus,
@@ -1103,7 +1104,7 @@ JSON만 출력하세요."""
         obj_match = re.search(r'\{[\s\S]*\}', text)
         if obj_match:
             try:
-                return json.loads(obj_match.group())
+                return _json_loads(obj_match.group())
             except json.JSONDecodeError:
                 pass
         
@@ -1111,7 +1112,7 @@ JSON만 출력하세요."""
         arr_match = re.search(r'\[[\s\S]*\]', text)
         if arr_match:
             try:
-                return json.loads(arr_match.group())
+                return _json_loads(arr_match.group())
             except json.JSONDecodeError:
                 pass
         
@@ -39,6 +39,7 @@ try:
 except Exception:
     google_exceptions = None
 
+from core.json_utils import json_loads as _json_loads
 from core.data_models import (
     PublicHousingReviewResult,
     DocumentStatus,
@@ -522,7 +523,7 @@ class UltraUnifiedPDFAnalyzer:
         array_match = re.search(r'\[[\s\S]*?\]', text)
         if array_match:
             try:
-                return json.loads(array_match.group())
+                return _json_loads(array_match.group())
             except json.JSONDecodeError:
                 pass
         
@@ -9,18 +9,23 @@
 """
 from __future__ import annotations
 
-import json
+import functools
+import hashlib
+import heapq
+import logging
 import os
 import io
 import random
 import re
+import threading
 import time
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List, Dict, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
 from dotenv import load_dotenv
+from core.json_utils import json_loads as _json_loads
 from core.api_rate_limiter import get_global_limiter
 
 try:
@@ -49,6 +54,19 @@ try:
 except Exception:
     google_exceptions = None
 
+# 시험성적서 키워드 다중 매칭: hyperscan → pyahocorasick → 정규식 순으로 사용 가능한 것 선택
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 from core.data_models import (
     PublicHousingReviewResult,
     DocumentStatus,
@@ -57,6 +75,8 @@ from core.data_models import (
 )
 from core.vision_client import create_vision_client
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # 문서 유형 정의
@@ -96,6 +116,10 @@ class DocType(str, Enum):
     UNKNOWN = "미확인문서"
 
 
+# 등기부등본 (건물/토지 공통 프롬프트 사용)
+_REGISTRY_TYPES = frozenset({DocType.BUILDING_REGISTRY, DocType.LAND_REGISTRY})
+
+
 # =============================================================================
 # 문서 감지 키워드 (정확도 향상)
 # =============================================================================
@@ -189,6 +213,246 @@ DOC_DETECTION_RULES = {
 }
 
 
+# 작성일·발급일 파싱용 (YYYY-MM-DD / YYYY.MM.DD / YYYY/MM/DD)
+_DATE_RE = re.compile(r"^\s*(\d{4})[-./](\d{1,2})[-./](\d{1,2})")
+
+
+def _parse_ymd(s: Any) -> Optional[date]:
+    """날짜 문자열 → date. strptime 포맷 순회 대신 정규식 1회 매칭 후 int로 직접 생성"""
+    if not s:
+        return None
+    s = str(s).strip()
+    # ISO(YYYY-MM-DD) 형식은 C 구현 fromisoformat으로 바로 처리
+    if s[4:5] == "-" and s[7:8] == "-":
+        try:
+            return date.fromisoformat(s[:10])
+        except ValueError:
+            pass
+    # "." / "/" 구분자 및 한 자리 월·일은 정규식으로 폴백
+    m = _DATE_RE.match(s)
+    if not m:
+        return None
+    try:
+        return date(int(m[1]), int(m[2]), int(m[3]))
+    except ValueError:  # 13월·32일 등 잘못된 날짜
+        return None
+
+
+def _is_after(raw: Any, ann: Optional[date], default: Any = True) -> Any:
+    """작성일·발급일이 공고일 이후인지. 날짜·공고일이 없거나 파싱 실패로 비교할 수 없으면 default 반환"""
+    if ann is None or not raw:
+        return default
+    d = _parse_ymd(raw)
+    return d >= ann if d is not None else default
+
+
+# 사용승인일 비교용 (YYYY년 M월 D일 / YYYY. M. D 등 공백·한글 구분자 허용)
+_YMD_LOOSE_RE = re.compile(r"(\d{4})\s*[년./-]\s*(\d{1,2})\s*[월./-]\s*(\d{1,2})")
+
+# 전화번호 숫자만 추출 / 면적 등 숫자 문자열 정리용
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+_NON_NUMERIC_RE = re.compile(r"[^\d.-]")
+
+
+# AI 응답에서 "값 없음"으로 간주할 문자열 (strip + lower 후 비교)
+_EMPTY_STRINGS = frozenset(("null", "none", "-", "없음", ""))
+
+# 0이 유효한 값인 필드 키 표식 (면적·개수)
+_AREA_COUNT_MARKER = ("area", "count")
+
+# 소유자가 개인이 아님(법인·건설 등)을 나타내는 법인 형태 키워드 — 단일 정규식으로 1회 스캔
+# (신청인 유형 표시용: 사업 분야 키워드까지 포함하는 CORP_KEYWORDS는 "김상호" 같은 개인명도 잡으므로 사용하지 않음)
+_CORP_RE = re.compile(
+    "|".join(map(re.escape, (
+        "법인", "건설", "주식회사", "(주)", "주)", "㈜", "사단법인", "재단법인",
+        "농협", "조합", "코퍼레이션", "corp", "inc",
+    ))),
+    re.IGNORECASE,
+)
+
+# 주택매도신청서 소유자 필드별 키 별칭 (앞쪽일수록 우선)
+_OWNER_FIELD_ALIASES = {
+    "name": ("owner_name", "name", "성명", "소유자", "소유주",
+             "applicant_name", "신청인", "매도인", "성명(한글)", "상호"),
+    "birth": ("owner_birth", "birth_date", "생년월일", "birth",
+              "resident_number", "주민번호", "주민등록번호"),
+    "address": ("owner_address", "address", "주소", "현거주지",
+                "home_address", "거주지", "현주소", "주소지"),
+    "phone": ("owner_phone", "phone", "휴대전화", "연락처", "전화번호",
+              "휴대폰", "mobile", "contact", "핸드폰", "휴대전화번호"),
+    "email": ("owner_email", "email", "이메일", "이메일주소",
+              "email_address", "e-mail", "mail"),
+}
+
+# 중첩 owner_info 객체의 별칭 (최상위와 순서·범위가 다름: 일반 키 "name" 등이 우선)
+_OWNER_INFO_FIELD_ALIASES = {
+    "name": ("name", "owner_name", "성명", "소유자", "소유주", "상호"),
+    "birth": ("birth_date", "owner_birth", "생년월일", "birth"),
+    "address": ("address", "owner_address", "주소", "현거주지"),
+    "phone": ("phone", "owner_phone", "휴대전화", "연락처", "전화번호"),
+    "email": ("email", "owner_email", "이메일", "이메일주소"),
+}
+
+# 중첩 applicant 객체의 별칭 (이름만)
+_APPLICANT_FIELD_ALIASES = {
+    "name": ("name", "성명", "상호"),
+}
+
+
+def _owner_field_map(aliases: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, int]]:
+    """별칭 → (필드, 우선순위) 역색인: dict.items()를 한 번만 순회하기 위함"""
+    return {
+        alias: (field_name, rank)
+        for field_name, field_aliases in aliases.items()
+        for rank, alias in enumerate(field_aliases)
+    }
+
+
+# 소스 dict별 역색인 (최상위 / owner_info / applicant)
+_OWNER_FIELD_MAP = _owner_field_map(_OWNER_FIELD_ALIASES)
+_OWNER_INFO_FIELD_MAP = _owner_field_map(_OWNER_INFO_FIELD_ALIASES)
+_APPLICANT_FIELD_MAP = _owner_field_map(_APPLICANT_FIELD_ALIASES)
+
+
+def _collect_owner_fields(src: Dict, found: Dict[str, Any], field_map: Dict[str, Tuple[str, int]]) -> None:
+    """src를 1회 순회하며 소유자 필드를 found에 채움 (이미 찾은 필드는 유지, 소스별 별칭 우선순위 적용)"""
+    best: Dict[str, Tuple[int, Any]] = {}
+    for k, v in src.items():
+        spec = field_map.get(k)
+        if spec is None:
+            continue
+        f, rank = spec
+        if f in found:
+            continue
+        if v is None:
+            continue
+        if isinstance(v, str):
+            sv = v.strip()
+            if not sv or sv.lower() in _EMPTY_STRINGS:
+                continue
+        elif isinstance(v, (int, float)) and v == 0:
+            continue
+        if f not in best or rank < best[f][0]:
+            best[f] = (rank, v)
+    for f, (_, v) in best.items():
+        found[f] = v
+
+
+# 반복 조회되는 필드의 키 별칭 (호출마다 *args 튜플을 만들지 않도록 모듈 상수로 고정)
+_PROPERTY_ADDRESS_ALIASES = ("property_address", "소재지", "주소", "물건소재지", "매도주택소재지")
+_APPLICATION_APPROVAL_DATE_ALIASES = ("approval_date", "사용승인일", "승인일", "건물사용승인일", "준공일")
+_REGISTRY_APPROVAL_DATE_ALIASES = ("approval_date", "사용승인일", "승인일", "use_approval_date")
+_ISSUE_DATE_ALIASES = ("issue_date", "발급일", "작성일")
+_LH_OWNER_NAME_ALIASES = ("owner_name", "name", "소유자")
+_WRITTEN_DATE_ALIASES = ("written_date", "작성일", "issue_date", "작성일자", "신청일")
+_LAND_AREA_ALIASES = ("land_area", "면적", "대지면적")
+
+# 준공도면 자재 필드별 키 별칭 (필드명 → 별칭 튜플, 클래스 로드 시 1회 고정)
+_AS_BUILT_MATERIAL_ALIASES = {
+    "exterior_finish_material": ("exterior_finish_material", "외벽마감", "외벽마감재료"),
+    "exterior_insulation_material": ("exterior_insulation_material", "외벽단열", "외벽단열재료"),
+    "piloti_finish_material": ("piloti_finish_material", "필로티마감", "필로티마감재료"),
+    "piloti_insulation_material": ("piloti_insulation_material", "필로티단열", "필로티단열재료"),
+}
+
+
+# 시험성적서 detected_tests 텍스트 검증 키워드 (모두 소문자 — 소문자화한 텍스트와 비교)
+_TEST_CERT_KEYWORDS = {
+    # 열방출시험
+    "heat": (
+        "열방출", "총열방출량", "열방출률", "열방출율", "열량방출",
+        "thr", "total heat release", "heat release rate", "hrr",
+        "발열량", "발열율", "열에너지",
+        "cone calorimeter", "콘칼로리미터",
+        "5660", "iso 5660", "ks f iso 5660",
+    ),
+    # 가스유해성시험
+    "gas": (
+        "가스유해성", "가스유해", "가스독성", "연소가스유해성", "연소가스",
+        "gas toxicity", "gas toxic", "toxicity test",
+        "유해가스", "유독가스", "연기독성", "연기유해성",
+        "2271", "ks f 2271",
+        "마우스", "mouse", "동물시험",
+    ),
+    # 열전도율시험 (제외 대상)
+    "thermal": (
+        "열전도율", "열전도", "열전도계수", "단열성능", "단열시험",
+        "thermal conductivity", "k-value", "k값",
+        "8302", "ks l iso 8302", "9016", "ks l 9016",
+    ),
+}
+
+_TEST_CERT_CATS = tuple(_TEST_CERT_KEYWORDS)
+
+if HAS_HYPERSCAN:
+    # 전체 키워드를 하나의 DFA DB로 컴파일 — id로 분류 식별 (스크래치는 스레드별 1회 할당)
+    _TEST_CERT_HS_IDS = [
+        _TEST_CERT_CATS.index(_cat)
+        for _cat, _kws in _TEST_CERT_KEYWORDS.items() for _kw in _kws
+    ]
+    _TEST_CERT_HS = hyperscan.Database()
+    _TEST_CERT_HS.compile(
+        expressions=[
+            re.escape(_kw).encode("utf-8")
+            for _kws in _TEST_CERT_KEYWORDS.values() for _kw in _kws
+        ],
+        ids=_TEST_CERT_HS_IDS,
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_TEST_CERT_HS_IDS),
+    )
+    _TEST_CERT_HS_LOCAL = threading.local()
+else:
+    _TEST_CERT_HS = None
+
+if HAS_AHOCORASICK:
+    # 전체 키워드를 하나의 오토마톤으로 — 텍스트 1회 선형 스캔으로 분류 판정
+    _TEST_CERT_AC = ahocorasick.Automaton()
+    for _cat, _kws in _TEST_CERT_KEYWORDS.items():
+        for _kw in _kws:
+            _TEST_CERT_AC.add_word(_kw, _cat)
+    _TEST_CERT_AC.make_automaton()
+else:
+    _TEST_CERT_AC = None
+
+# 오토마톤이 없을 때의 폴백: 분류별 단일 정규식 (긴 키워드 우선, C 레벨 1회 스캔)
+_TEST_CERT_RES = {
+    cat: re.compile("|".join(map(re.escape, sorted(kws, key=len, reverse=True))), re.IGNORECASE)
+    for cat, kws in _TEST_CERT_KEYWORDS.items()
+}
+
+
+def _scan_test_cert_keywords(text: str, known: frozenset = frozenset()) -> set:
+    """소문자화된 텍스트에서 매칭된 시험 분류(heat/gas/thermal) 집합 반환.
+    known: 이미 판정된 분류 — 스캔하지 않고 결과에 포함 (전부 판정됐으면 스캔 생략)"""
+    found = set(known)
+    if not text or len(found) == len(_TEST_CERT_KEYWORDS):
+        return found
+    if _TEST_CERT_HS is not None:
+        scratch = getattr(_TEST_CERT_HS_LOCAL, "scratch", None)
+        if scratch is None:
+            scratch = _TEST_CERT_HS_LOCAL.scratch = hyperscan.Scratch(_TEST_CERT_HS)
+
+        def _on_match(cat_id, _from, _to, _flags, _ctx):
+            found.add(_TEST_CERT_CATS[cat_id])
+            # 모든 분류 판정 시 스캔 중단
+            return len(found) == len(_TEST_CERT_CATS)
+
+        try:
+            _TEST_CERT_HS.scan(text.encode("utf-8"), match_event_handler=_on_match, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            pass
+        return found
+    if _TEST_CERT_AC is not None:
+        for _, cat in _TEST_CERT_AC.iter(text):
+            found.add(cat)
+            if len(found) == len(_TEST_CERT_KEYWORDS):
+                break
+        return found
+    for cat, pattern in _TEST_CERT_RES.items():
+        if cat not in found and pattern.search(text):
+            found.add(cat)
+    return found
+
+
 # =============================================================================
 # 페이지 분석 결과
 # =============================================================================
@@ -204,14 +468,24 @@ class PageAnalysis:
     image: Optional[Image.Image] = None
 
 
+def _normalize_merged_data(raw: Any) -> Dict[str, Any]:
+    """AI 응답 데이터를 dict로 정규화 (예: [{ "exists": true, ... }] → 첫 번째 객체, 그 외 비-dict → {})"""
+    if isinstance(raw, list):
+        raw = raw[0] if raw else None
+    return raw if isinstance(raw, dict) else {}
+
+
 @dataclass
 class DocumentInfo:
-    """감지된 문서 정보"""
+    """감지된 문서 정보 (merged_data는 생성 시 항상 dict로 정규화됨)"""
     doc_type: DocType
     pages: List[int]
     merged_data: Dict[str, Any]
     confidence: float
 
+    def __post_init__(self):
+        self.merged_data = _normalize_merged_data(self.merged_data)
+
 
 # =============================================================================
 # 통합 분석 시스템
@@ -352,18 +626,23 @@ class UnifiedPDFAnalyzer:
         """
         if not name:
             return False
-        
+        return self._is_corporation_name(name)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_corporation_name(cls, name: str) -> bool:
+        """_detect_corporation_from_name 본체 (순수 문자열 → bool, 같은 소유자 이름 반복 시 캐시 적중)"""
         name_normalized = name.replace(" ", "").replace("\n", "").strip()
         name_lower = name.lower()
         
         # 1단계: 직접 키워드 매칭
-        for keyword in self.CORP_KEYWORDS:
+        for keyword in cls.CORP_KEYWORDS:
             if keyword.lower() in name_lower or keyword in name_normalized:
                 return True
         
         # 2단계: 정규표현식 패턴 매칭
         import re
-        for pattern in self.CORP_PATTERNS:
+        for pattern in cls.CORP_PATTERNS:
             if re.search(pattern, name_normalized, re.IGNORECASE):
                 return True
         
@@ -1574,7 +1853,7 @@ JSON만 출력하세요."""
 
 JSON만 출력하세요."""
 
-        elif doc_type in [DocType.BUILDING_REGISTRY, DocType.LAND_REGISTRY]:
+        elif doc_type in _REGISTRY_TYPES:
             return base + """이 문서는 **등기부등본**입니다.
 
 다음 정보를 추출하세요:
@@ -1633,20 +1912,20 @@ JSON만 출력하세요."""
             if match:
                 text = match.group(1)
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return _json_loads(text)
+        except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError 모두 ValueError 하위
             # [ ] 배열 추출 (배치 유형 판별 응답용)
             arr = re.search(r'\[[\s\S]*\]', text)
             if arr:
                 try:
-                    return json.loads(arr.group())
-                except Exception:
+                    return _json_loads(arr.group())
+                except ValueError:
                     pass
             obj = re.search(r'\{[\s\S]*\}', text)
             if obj:
                 try:
-                    return json.loads(obj.group())
-                except Exception:
+                    return _json_loads(obj.group())
+                except ValueError:
                     pass
             return {}
     
@@ -1662,23 +1941,17 @@ JSON만 출력하세요."""
             if len(group) == 1:
                 merged_list.append(group[0])
                 continue
-            all_pages = []
             merged_data = {}
             for d in group:
-                all_pages.extend(d.pages)
-                raw = d.merged_data
-                if isinstance(raw, list) and raw and isinstance(raw[0], dict):
-                    raw = raw[0]
-                if not isinstance(raw, dict):
-                    continue
-                for k, v in raw.items():
+                for k, v in d.merged_data.items():
                     if v is None or v == "" or v == []:
                         continue
                     if k not in merged_data or merged_data[k] in (None, "", []):
                         merged_data[k] = v
             merged_list.append(DocumentInfo(
                 doc_type=doc_type,
-                pages=sorted(all_pages),
+                # 각 d.pages는 _analyze_with_gemini에서 페이지 순으로 생성됨 → 정렬된 run 병합
+                pages=list(heapq.merge(*(d.pages for d in group))),
                 merged_data=merged_data,
                 confidence=max(d.confidence for d in group),
             ))
@@ -1687,17 +1960,28 @@ JSON만 출력하세요."""
     @staticmethod
     def _get_first(data: Dict, *keys: str):
         """여러 키 이름으로 첫 번째 비어 있지 않은 값을 반환. 있는 정보를 누락하지 않도록 함."""
+        return UnifiedPDFAnalyzer._first(data, keys)
+
+    @staticmethod
+    def _first(data: Dict, keys: Tuple[str, ...]):
+        """_get_first와 동일하나 별칭 튜플을 그대로 받음 (모듈 상수 별칭용)"""
         for k in keys:
             v = data.get(k)
             if v is None:
                 continue
-            if isinstance(v, str) and (not v.strip() or v.strip().lower() in ("null", "none", "-", "없음")):
-                continue
-            if isinstance(v, (int, float)) and v == 0 and "area" not in k and "count" not in k:
+            if isinstance(v, str):
+                sv = v.strip()
+                if not sv or sv.lower() in _EMPTY_STRINGS:
+                    continue
+            elif isinstance(v, (int, float)) and v == 0 and not any(m in k for m in _AREA_COUNT_MARKER):
                 continue
             return v
         return None
 
+    def _written_date(self, data: Dict) -> Optional[str]:
+        """작성일 (신청서·위임장·공사직원 확인서 공통 별칭)"""
+        return self._first(data, _WRITTEN_DATE_ALIASES)
+
     @staticmethod
     def _parse_float(val) -> Optional[float]:
         """숫자 또는 문자열을 float으로 변환."""
@@ -1706,7 +1990,7 @@ JSON만 출력하세요."""
         if isinstance(val, (int, float)):
             return float(val)
         if isinstance(val, str):
-            s = re.sub(r"[^\d.-]", "", val.replace(",", ""))
+            s = _NON_NUMERIC_RE.sub("", val.replace(",", ""))
             try:
                 return float(s) if s else None
             except ValueError:
@@ -1739,87 +2023,52 @@ JSON만 출력하세요."""
         )
         
         for doc in ordered:
-            data = doc.merged_data
-            # AI가 JSON을 리스트로 반환한 경우(예: [{ "exists": true, ... }]) dict로 정규화
-            if isinstance(data, list):
-                data = (data[0] if data and isinstance(data[0], dict) else {}) or {}
-            if not isinstance(data, dict):
-                data = {}
+            data = doc.merged_data  # DocumentInfo 생성 시 dict로 정규화됨
             
             if doc.doc_type == DocType.HOUSING_SALE_APPLICATION:
                 # ★ PDF 원본 텍스트 전달 (AI 추출 실패 시 폴백용)
                 self._apply_housing_application(result, data, raw_pdf_text)
-            
-            elif doc.doc_type == DocType.RENTAL_STATUS:
-                self._apply_rental_status(result, data)
-            
-            elif doc.doc_type == DocType.POWER_OF_ATTORNEY:
-                self._apply_power_of_attorney(result, data)
-            
-            elif doc.doc_type == DocType.CONSENT_FORM:
-                self._apply_consent_form(result, data)
-            
-            elif doc.doc_type == DocType.INTEGRITY_PLEDGE:
-                self._apply_integrity_pledge(result, data)
-            
-            elif doc.doc_type == DocType.LH_EMPLOYEE_CONFIRM:
-                self._apply_lh_confirm(result, data)
-            
-            elif doc.doc_type == DocType.SEAL_CERTIFICATE:
-                self._apply_seal_certificate(result, data)
-            
-            elif doc.doc_type == DocType.BUILDING_LEDGER_TITLE:
-                self._apply_building_ledger_title(result, data)
-            elif doc.doc_type == DocType.BUILDING_LEDGER_SUMMARY:
-                self._apply_building_ledger_summary(result, data)
-            
-            elif doc.doc_type == DocType.BUILDING_LEDGER_EXCLUSIVE:
-                self._apply_building_ledger_exclusive(result, data)
-            
-            elif doc.doc_type == DocType.BUILDING_LAYOUT:
-                self._apply_building_layout(result, data)
-            
-            elif doc.doc_type == DocType.LAND_LEDGER:
-                self._apply_land_ledger(result, data)
-            
-            elif doc.doc_type == DocType.LAND_USE_PLAN:
-                self._apply_land_use_plan(result, data)
-            
-            elif doc.doc_type == DocType.BUILDING_REGISTRY:
-                self._apply_building_registry(result, data)
-            
-            elif doc.doc_type == DocType.LAND_REGISTRY:
-                self._apply_land_registry(result, data)
-            
-            elif doc.doc_type == DocType.AGENT_ID_CARD:
-                # 대리인신분증사본이 있으면 제출·이름 일치된 것으로 간주
-                if data.get("exists", True):
-                    result.housing_sale_application.agent_info.exists = True
-                    result.housing_sale_application.agent_info.id_card_match = True
-            
-            # 🔥 법인 서류 처리 추가
-            elif doc.doc_type == DocType.BUSINESS_REGISTRATION:
-                if data.get("exists", True):
-                    result.corporate_documents.business_registration.exists = True
-                    result.corporate_documents.is_corporation = True
-                    print(f"    [법인 서류 감지] 사업자등록증 발견 → is_corporation=True")
-            
-            elif doc.doc_type == DocType.AS_BUILT_DRAWING:
-                self._apply_as_built_drawing(result, data)
-            elif doc.doc_type == DocType.TEST_CERTIFICATE:
-                self._apply_test_certificate(result, data)
-            elif doc.doc_type == DocType.DELIVERY_CONFIRMATION:
-                self._apply_delivery_confirmation(result, data)
+                continue
+            apply_name = self._APPLY_METHODS.get(doc.doc_type)
+            if apply_name:
+                getattr(self, apply_name)(result, data)
         
         self._reconcile_result(result, announcement_date)
         return result
     
+    # 문서 유형 → 적용 메서드 (주택매도신청서는 원본 텍스트가 필요해 _build_result에서 별도 처리)
+    _APPLY_METHODS = {
+        DocType.RENTAL_STATUS: "_apply_rental_status",
+        DocType.POWER_OF_ATTORNEY: "_apply_power_of_attorney",
+        DocType.CONSENT_FORM: "_apply_consent_form",
+        DocType.INTEGRITY_PLEDGE: "_apply_integrity_pledge",
+        DocType.LH_EMPLOYEE_CONFIRM: "_apply_lh_confirm",
+        DocType.SEAL_CERTIFICATE: "_apply_seal_certificate",
+        DocType.BUILDING_LEDGER_TITLE: "_apply_building_ledger_title",
+        DocType.BUILDING_LEDGER_SUMMARY: "_apply_building_ledger_summary",
+        DocType.BUILDING_LEDGER_EXCLUSIVE: "_apply_building_ledger_exclusive",
+        DocType.BUILDING_LAYOUT: "_apply_building_layout",
+        DocType.LAND_LEDGER: "_apply_land_ledger",
+        DocType.LAND_USE_PLAN: "_apply_land_use_plan",
+        DocType.BUILDING_REGISTRY: "_apply_building_registry",
+        DocType.LAND_REGISTRY: "_apply_land_registry",
+        DocType.AGENT_ID_CARD: "_apply_agent_id_card",
+        DocType.BUSINESS_REGISTRATION: "_apply_business_registration",
+        DocType.AS_BUILT_DRAWING: "_apply_as_built_drawing",
+        DocType.TEST_CERTIFICATE: "_apply_test_certificate",
+        DocType.DELIVERY_CONFIRMATION: "_apply_delivery_confirmation",
+    }
+    
+    @staticmethod
+    def _apply_common(section, data: Dict) -> bool:
+        """모든 _apply_* 공통 처리: exists(기본 true)·status 설정. 설정된 exists 반환."""
+        section.exists = data.get("exists", True)
+        section.status = DocumentStatus.VALID
+        return section.exists
+    
     def _reconcile_result(self, result: PublicHousingReviewResult, announcement_date: str):
         """서류 간 일치·날짜 검증. 있는 값을 기준으로 일치/유효만 설정하고, 없으면 보완서류로 넘기지 않음."""
-        try:
-            ann = datetime.strptime(announcement_date, "%Y-%m-%d").date()
-        except Exception:
-            ann = None
+        ann = _parse_ymd(announcement_date)
         
         # 대지면적 일치: 2개 이상 있으면 비교. 일치하면 match=True(있는데 불일치라고 하지 않음)
         la_app = self._parse_float(result.housing_sale_application.land_area)
@@ -1838,45 +2087,27 @@ JSON만 출력하세요."""
         app_date = (result.housing_sale_application.approval_date or "").strip()
         title_date = (getattr(result.building_ledger_title, "approval_date", None) or "").strip()
         
-        def _norm_date(s: str) -> str:
-            """날짜 문자열에서 숫자만 추출 (YYYYMMDD)"""
-            if not s:
-                return ""
-            digits = re.sub(r"\D", "", s)
-            # 6자리면 YYMMDD → YYYYMMDD
-            if len(digits) == 6:
-                digits = "20" + digits
-            # 7자리면 잘못된 형식이지만 최대한 처리
-            if len(digits) == 7:
-                digits = "20" + digits[1:]  # 앞자리 추가
-            return digits[:8]
-        
-        def _parse_to_ymd(s: str) -> tuple:
-            """날짜 문자열 → (년, 월, 일) 튜플"""
+        def _parse_to_ymd(s: str) -> Optional[int]:
+            """날짜 문자열 → YYYYMMDD 정수 (예: 20240315). 연월 비교는 // 100"""
             if not s:
                 return None
-            # 직접 파싱 시도
-            for fmt in ("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d", "%Y. %m. %d", "%Y년 %m월 %d일", "%Y년%m월%d일"):
-                try:
-                    d = datetime.strptime(s.strip()[:24], fmt)
-                    return (d.year, d.month, d.day)
-                except (ValueError, TypeError):
-                    continue
-            # 정규식으로 추출
-            import re
-            m = re.match(r"(\d{4})\s*[년./-]\s*(\d{1,2})\s*[월./-]\s*(\d{1,2})", s)
+            # YYYY-MM-DD / YYYY.MM.DD / YYYY/MM/DD (예외 없이 판별)
+            d = _parse_ymd(s)
+            if d is not None:
+                return d.year * 10000 + d.month * 100 + d.day
+            # "YYYY. M. D" / "YYYY년 M월 D일" 등 공백·한글 구분자
+            m = _YMD_LOOSE_RE.match(s.strip())
             if m:
-                try:
-                    return (int(m.group(1)), int(m.group(2)), int(m.group(3)))
-                except:
-                    pass
-            # 숫자만 추출
-            nd = _norm_date(s)
-            if len(nd) >= 8:
-                try:
-                    return (int(nd[:4]), int(nd[4:6]), int(nd[6:8]))
-                except:
-                    pass
+                return int(m.group(1)) * 10000 + int(m.group(2)) * 100 + int(m.group(3))
+            # 숫자만 추출 (YYMMDD → 20YYMMDD, 7자리는 앞자리 보정)
+            digits = "".join(c for c in s if c.isdecimal())
+            n = len(digits)
+            if n == 6:
+                digits = "20" + digits
+            elif n == 7:
+                digits = "20" + digits[1:]
+            if len(digits) >= 8:
+                return int(digits[:8])
             return None
         
         # 디버그 로그
@@ -1892,23 +2123,14 @@ JSON만 출력하세요."""
                 if app_ymd == title_ymd:
                     result.housing_sale_application.approval_date_match = True
                     print(f"    [사용승인일 비교] → 완전 일치")
-                elif app_ymd[:2] == title_ymd[:2]:
+                elif app_ymd // 100 == title_ymd // 100:
                     # 연월만 같으면 일치로 간주 (일자 오타 허용)
                     result.housing_sale_application.approval_date_match = True
                     print(f"    [사용승인일 비교] → 연월 일치 (일자 차이 허용)")
                 else:
-                    # 숫자로 비교 (폴백)
-                    nd_app, nd_title = _norm_date(app_date), _norm_date(title_date)
-                    if nd_app == nd_title:
-                        result.housing_sale_application.approval_date_match = True
-                        print(f"    [사용승인일 비교] → 숫자 비교 일치: {nd_app}")
-                    elif nd_app[:6] == nd_title[:6]:
-                        result.housing_sale_application.approval_date_match = True
-                        print(f"    [사용승인일 비교] → 연월 숫자 일치")
-                    else:
-                        # 명시적으로 False 설정 (실제 불일치)
-                        result.housing_sale_application.approval_date_match = False
-                        print(f"    [사용승인일 비교] → 불일치: {nd_app} != {nd_title}")
+                    # 명시적으로 False 설정 (실제 불일치)
+                    result.housing_sale_application.approval_date_match = False
+                    print(f"    [사용승인일 비교] → 불일치: {app_ymd} != {title_ymd}")
             else:
                 # 파싱 실패 시 일치로 간주
                 result.housing_sale_application.approval_date_match = True
@@ -1924,81 +2146,45 @@ JSON만 출력하세요."""
             poa_la = self._parse_float(poa.land_area)
             if poa_la is not None and abs(poa_la - la_app) <= 0.01:
                 poa.land_area_match = True
-        if poa.exists and poa.written_date and ann:
-            try:
-                for fmt in ("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d"):
-                    try:
-                        d = datetime.strptime(poa.written_date.strip()[:10], fmt).date()
-                        if d >= ann:
-                            poa.is_after_announcement = True
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
-                pass
-        
-        # 개인정보동의서 작성일 유효 (문서 있으면 있는 것으로 간주. 날짜 있으면 유효로 간주)
-        if result.consent_form.exists:
-            for date_attr, valid_attr in [
-                ("owner_written_date", "owner_date_valid"),
-                ("agent_written_date", "agent_date_valid"),
-            ]:
-                date_val = getattr(result.consent_form, date_attr, None)
-                if date_val and isinstance(date_val, str):
-                    try:
-                        for fmt in ("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d"):
-                            try:
-                                d = datetime.strptime(date_val.strip()[:10], fmt).date()
-                                setattr(result.consent_form, valid_attr, d >= ann if ann else True)
-                                break
-                            except ValueError:
-                                continue
-                        else:
-                            setattr(result.consent_form, valid_attr, True)  # 파싱 실패해도 문서 있으면 유효로 간주
-                    except Exception:
-                        setattr(result.consent_form, valid_attr, True)
-                else:
-                    setattr(result.consent_form, valid_attr, True)  # 작성일 없어도 문서 있으면 유효로 간주
-        # 공사직원확인서 작성일 유효
-        if ann and result.lh_employee_confirmation.exists and result.lh_employee_confirmation.written_date:
-            try:
-                for fmt in ("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d"):
-                    try:
-                        d = datetime.strptime(result.lh_employee_confirmation.written_date.strip()[:10], fmt).date()
-                        result.lh_employee_confirmation.date_valid = d >= ann
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
-                pass
-        
-        # 토지대장 발급일 공고일 이후
-        if ann and result.land_ledger.exists and getattr(result.land_ledger, "issue_date", None):
-            try:
-                for fmt in ("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d"):
-                    try:
-                        d = datetime.strptime(str(result.land_ledger.issue_date).strip()[:10], fmt).date()
-                        result.land_ledger.is_after_announcement = d >= ann
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
-                pass
+        if poa.exists and _is_after(poa.written_date, ann, default=False):
+            poa.is_after_announcement = True
+        
+        # 개인정보동의서 작성일 유효 (문서 있으면 있는 것으로 간주. 작성일이 없거나 파싱 실패해도 유효로 간주)
+        consent = result.consent_form
+        if consent.exists:
+            consent.owner_date_valid = _is_after(consent.owner_written_date, ann)
+            consent.agent_date_valid = _is_after(consent.agent_written_date, ann)
+        # 공사직원확인서 작성일 유효 (비교 불가 시 기존 값 유지)
+        lh = result.lh_employee_confirmation
+        if lh.exists:
+            lh.date_valid = _is_after(lh.written_date, ann, default=lh.date_valid)
+        
+        # 토지대장 발급일 공고일 이후 (비교 불가 시 기존 값 유지)
+        ledger = result.land_ledger
+        if ledger.exists:
+            ledger.is_after_announcement = _is_after(ledger.issue_date, ann, default=ledger.is_after_announcement)
         
         # 임대현황 vs 전유부: 호·면적 비교 (둘 다 있을 때만 불일치 목록 설정)
-        rent_units = getattr(result.rental_status, "units", []) or []
-        excl_units = getattr(result.building_ledger_exclusive, "units", []) or []
+        # units는 _apply_rental_status / _apply_building_ledger_exclusive에서 UnitInfo / ExclusiveUnit으로 생성됨
+        rent_units = result.rental_status.units
+        excl_units = result.building_ledger_exclusive.units
         if rent_units and excl_units:
-            excl_map = {getattr(u, "unit_number", None) or getattr(u, "unit", str(u)): getattr(u, "exclusive_area", None) or getattr(u, "area", None) for u in excl_units}
+            # 전유부 면적은 호별로 1회만 파싱해 색인 (면적 0은 미추출로 간주)
+            # 호수가 빈 문자열인 호(AI가 호수 누락)는 서로 짝지을 수 없으므로 양쪽 모두 제외
+            excl_map = {
+                u.unit_number: self._parse_float(u.exclusive_area or None)
+                for u in excl_units if u.unit_number
+            }
             mismatched = []
             for ru in rent_units:
-                unum = getattr(ru, "unit_number", None) or getattr(ru, "unit", "")
-                uarea = self._parse_float(getattr(ru, "exclusive_area", None) or getattr(ru, "area", None))
-                if unum not in excl_map or uarea is None:
+                unum = ru.unit_number
+                if not unum:
                     continue
-                if self._parse_float(excl_map[unum]) is None:
+                uarea = self._parse_float(ru.exclusive_area or None)
+                ea = excl_map.get(unum)
+                if ea is None or uarea is None:
                     continue
-                if abs(uarea - self._parse_float(excl_map[unum])) > 0.01:
+                if abs(uarea - ea) > 0.01:
                     mismatched.append(str(unum))
             result.rental_status.mismatched_units = mismatched
         else:
@@ -2029,36 +2215,36 @@ JSON만 출력하세요."""
             data: AI가 추출한 데이터
             raw_text: PDF 원본 텍스트 (AI 실패 시 폴백용)
         """
-        result.housing_sale_application.exists = data.get("exists", True)
-        result.housing_sale_application.status = DocumentStatus.VALID
+        self._apply_common(result.housing_sale_application, data)
         
         # ★★★ 1단계: AI가 직접 추출한 is_corporation 값 먼저 적용 ★★★
         is_corp_from_ai = data.get("is_corporation")
         if is_corp_from_ai is True:
             result.corporate_documents.is_corporation = True
-            print(f"    [법인 감지 1단계] AI가 is_corporation=true 반환 → 법인으로 설정")
+            logger.debug("[법인 감지 1단계] AI가 is_corporation=true 반환 → 법인으로 설정")
         
         # 소유자 정보: 최상위 키 + owner_info 중첩 객체 + 다양한 한글/영문 키 모두 반영
         owner = result.housing_sale_application.owner_info
         
+        # 최상위 → owner_info → applicant(이름만) 순으로 각 dict를 1회씩 순회해 소유자 필드 수집
+        oi = data.get("owner_info")
+        ap = data.get("applicant")
+        owner_fields: Dict[str, Any] = {}
+        _collect_owner_fields(data, owner_fields, _OWNER_FIELD_MAP)
+        if isinstance(oi, dict) and len(owner_fields) < len(_OWNER_FIELD_ALIASES):
+            _collect_owner_fields(oi, owner_fields, _OWNER_INFO_FIELD_MAP)
+        if isinstance(ap, dict) and "name" not in owner_fields:
+            _collect_owner_fields(ap, owner_fields, _APPLICANT_FIELD_MAP)
+        
         # 이름 추출 (다양한 키 이름 지원)
-        name = self._get_first(data, 
-            "owner_name", "name", "성명", "소유자", "소유주", 
-            "applicant_name", "신청인", "매도인", "성명(한글)", "상호"
-        )
-        if not name and isinstance(data.get("owner_info"), dict):
-            name = self._get_first(data["owner_info"], 
-                "name", "owner_name", "성명", "소유자", "소유주", "상호"
-            )
-        if not name and isinstance(data.get("applicant"), dict):
-            name = self._get_first(data["applicant"], "name", "성명", "상호")
+        name = owner_fields.get("name")
         
         # ★★★ AI가 소유자 이름을 추출하지 못한 경우 PDF 텍스트에서 직접 추출 (폴백) ★★★
         if not name and raw_text:
-            print(f"    [소유자 추출 폴백] AI가 owner_name 미반환 → PDF 텍스트에서 직접 추출 시도...")
+            logger.debug("[소유자 추출 폴백] AI가 owner_name 미반환 → PDF 텍스트에서 직접 추출 시도...")
             name = self._extract_owner_name_from_text(raw_text)
             if name:
-                print(f"    [소유자 추출 폴백] 텍스트에서 소유자 이름 추출 성공: '{name}'")
+                logger.debug("[소유자 추출 폴백] 텍스트에서 소유자 이름 추출 성공: '%s'", name)
         
         # ★★★ 여전히 없으면 법인명 추출 시도 ★★★
         if not name and raw_text:
@@ -2066,25 +2252,19 @@ JSON만 출력하세요."""
             if corp_name:
                 name = corp_name
                 result.corporate_documents.is_corporation = True
-                print(f"    [소유자 추출 폴백] 텍스트에서 법인명 추출 성공: '{name}'")
+                logger.debug("[소유자 추출 폴백] 텍스트에서 법인명 추출 성공: '%s'", name)
         
-        if name and str(name).strip():
-            owner.name = str(name).strip()
+        name_str = str(name).strip() if name else ""
+        if name_str:
+            owner.name = name_str
             
             # ★★★ 2단계: 소유자 이름에서 법인 여부 자동 감지 (강화된 로직) ★★★
             if self._detect_corporation_from_name(owner.name):
                 result.corporate_documents.is_corporation = True
-                print(f"    [법인 감지 2단계] 소유자 이름에서 법인 감지: '{owner.name}' → is_corporation=True")
+                logger.debug("[법인 감지 2단계] 소유자 이름에서 법인 감지: '%s' → is_corporation=True", owner.name)
         
         # 생년월일 추출
-        birth = self._get_first(data, 
-            "owner_birth", "birth_date", "생년월일", "birth", 
-            "resident_number", "주민번호", "주민등록번호"
-        )
-        if not birth and isinstance(data.get("owner_info"), dict):
-            birth = self._get_first(data["owner_info"], 
-                "birth_date", "owner_birth", "생년월일", "birth"
-            )
+        birth = owner_fields.get("birth")
         if birth:
             # 주민번호 형식이면 앞 6자리만 추출
             birth_str = str(birth).strip()
@@ -2094,44 +2274,24 @@ JSON만 출력하세요."""
                 owner.birth_date = birth_str
         
         # 주소 추출
-        addr = self._get_first(data, 
-            "owner_address", "address", "주소", "현거주지", 
-            "home_address", "거주지", "현주소", "주소지"
-        )
-        if not addr and isinstance(data.get("owner_info"), dict):
-            addr = self._get_first(data["owner_info"], 
-                "address", "owner_address", "주소", "현거주지"
-            )
-        if addr and str(addr).strip():
-            owner.address = str(addr).strip()
+        addr = owner_fields.get("address")
+        addr_str = str(addr).strip() if addr else ""
+        if addr_str:
+            owner.address = addr_str
         
         # 전화번호 추출
-        phone = self._get_first(data, 
-            "owner_phone", "phone", "휴대전화", "연락처", "전화번호", 
-            "휴대폰", "mobile", "contact", "핸드폰", "휴대전화번호"
-        )
-        if not phone and isinstance(data.get("owner_info"), dict):
-            phone = self._get_first(data["owner_info"], 
-                "phone", "owner_phone", "휴대전화", "연락처", "전화번호"
-            )
+        phone = owner_fields.get("phone")
         if phone:
             phone_str = str(phone).strip()
             # 전화번호 정규화 (010-XXXX-XXXX 형식으로)
-            phone_digits = re.sub(r"[^\d]", "", phone_str)
+            phone_digits = _NON_DIGIT_RE.sub("", phone_str)
             if len(phone_digits) >= 10 and phone_digits.startswith("010"):
                 owner.phone = phone_str
             elif phone_str and phone_str.lower() not in ("null", "none", "-"):
                 owner.phone = phone_str
         
         # 이메일 추출
-        email = self._get_first(data, 
-            "owner_email", "email", "이메일", "이메일주소", 
-            "email_address", "e-mail", "mail"
-        )
-        if not email and isinstance(data.get("owner_info"), dict):
-            email = self._get_first(data["owner_info"], 
-                "email", "owner_email", "이메일", "이메일주소"
-            )
+        email = owner_fields.get("email")
         if email:
             email_str = str(email).strip()
             # 이메일 형식 검증
@@ -2139,21 +2299,18 @@ JSON만 출력하세요."""
                 owner.email = email_str
         
         # 소유자 정보 완비 판정 (3개 이상이면 완비로 간주)
-        filled_count = sum([
-            bool(owner.name),
-            bool(owner.birth_date),
-            bool(owner.address),
-            bool(owner.phone),
-            bool(owner.email),
-        ])
+        filled_count = 0
+        for f in (owner.name, owner.birth_date, owner.address, owner.phone, owner.email):
+            if f:
+                filled_count += 1
+                if filled_count >= 3:
+                    break
         owner.is_complete = filled_count >= 3 or (
             result.housing_sale_application.exists and filled_count >= 1
         )
         
         # 매도주택 정보
-        prop_addr = self._get_first(data, 
-            "property_address", "소재지", "주소", "물건소재지", "매도주택소재지"
-        )
+        prop_addr = self._first(data, _PROPERTY_ADDRESS_ALIASES)
         if prop_addr and not result.property_address:
             result.property_address = str(prop_addr).strip()
         
@@ -2163,9 +2320,7 @@ JSON만 출력하세요."""
         if land_area is not None:
             result.housing_sale_application.land_area = land_area
         
-        app_date = self._get_first(data, 
-            "approval_date", "사용승인일", "승인일", "건물사용승인일", "준공일"
-        )
+        app_date = self._first(data, _APPLICATION_APPROVAL_DATE_ALIASES)
         if app_date:
             result.housing_sale_application.approval_date = str(app_date).strip()
         
@@ -2177,9 +2332,7 @@ JSON만 출력하세요."""
             else:
                 result.housing_sale_application.seal_verification.seal_exists = True
         
-        written = self._get_first(data, 
-            "written_date", "작성일", "issue_date", "작성일자", "신청일"
-        )
+        written = self._written_date(data)
         if written:
             result.housing_sale_application.written_date = str(written).strip()
         
@@ -2194,16 +2347,13 @@ JSON만 출력하세요."""
         # 소유자가 개인이 아닐 때(법인·건설 등): 인식된 명칭을 저장하고 유형 표시
         if owner.name and isinstance(owner.name, str):
             name_trimmed = owner.name.strip()
-            if name_trimmed:
-                non_individual_keywords = ("법인", "건설", "주식회사", "(주)", "주)", "㈜", "사단법인", "재단법인", "농협", "조합", "코퍼레이션", "corp", "inc")
-                if any(kw in name_trimmed for kw in non_individual_keywords):
-                    result.applicant_type = ApplicantType.CORPORATION
-                    result.applicant_type_display = name_trimmed
+            if name_trimmed and _CORP_RE.search(name_trimmed):
+                result.applicant_type = ApplicantType.CORPORATION
+                result.applicant_type_display = name_trimmed
     
     def _apply_rental_status(self, result: PublicHousingReviewResult, data: Dict):
         """임대현황 적용"""
-        result.rental_status.exists = data.get("exists", True)
-        result.rental_status.status = DocumentStatus.VALID
+        self._apply_common(result.rental_status, data)
         
         units = data.get("units", [])
         if units:
@@ -2216,8 +2366,7 @@ JSON만 출력하세요."""
     
     def _apply_power_of_attorney(self, result: PublicHousingReviewResult, data: Dict):
         """위임장 적용. 있는 정보를 그대로 반영."""
-        result.power_of_attorney.exists = data.get("exists", True)
-        result.power_of_attorney.status = DocumentStatus.VALID
+        self._apply_common(result.power_of_attorney, data)
         d_name = self._get_first(data, "delegator_name", "위임인", "위임자")
         d_seal = data.get("delegator_seal", data.get("delegator_seal_valid", False))
         e_name = self._get_first(data, "delegatee_name", "수임인", "수임자")
@@ -2231,10 +2380,10 @@ JSON만 출력하세요."""
         loc = self._get_first(data, "property_address", "location", "소재지")
         if loc:
             result.power_of_attorney.location = str(loc).strip()
-        la = self._parse_float(self._get_first(data, "land_area", "대지면적"))
+        la = self._parse_float(self._first(data, _LAND_AREA_ALIASES))
         if la is not None:
             result.power_of_attorney.land_area = la
-        wd = self._get_first(data, "written_date", "작성일", "issue_date")
+        wd = self._written_date(data)
         if wd:
             result.power_of_attorney.written_date = str(wd).strip()
         result.housing_sale_application.agent_info.exists = True
@@ -2246,9 +2395,7 @@ JSON만 출력하세요."""
     
     def _apply_consent_form(self, result: PublicHousingReviewResult, data: Dict):
         """개인정보동의서 적용. 문서 있으면 소유자/대리인 작성·인감·작성일 있는 것으로 간주(기본 true)."""
-        result.consent_form.exists = data.get("exists", True)
-        result.consent_form.status = DocumentStatus.VALID
-        exists = result.consent_form.exists
+        exists = self._apply_common(result.consent_form, data)
         result.consent_form.owner_signed = data.get("owner_signed", data.get("owner_seal", True)) is True if exists else False
         result.consent_form.owner_seal_valid = data.get("owner_seal_valid", data.get("owner_seal", True)) is True if exists else False
         result.consent_form.agent_signed = data.get("agent_signed", data.get("agent_seal", True)) is True if exists else False
@@ -2262,9 +2409,7 @@ JSON만 출력하세요."""
     
     def _apply_integrity_pledge(self, result: PublicHousingReviewResult, data: Dict):
         """청렴서약서 적용. 문서 있으면 소유자/대리인 작성·인감 있는 것으로 간주(기본 true)."""
-        result.integrity_pledge.exists = data.get("exists", True)
-        result.integrity_pledge.status = DocumentStatus.VALID
-        exists = result.integrity_pledge.exists
+        exists = self._apply_common(result.integrity_pledge, data)
         result.integrity_pledge.owner_submitted = data.get("owner_submitted", data.get("owner_signed", True)) is True if exists else False
         result.integrity_pledge.owner_seal_valid = data.get("owner_seal_valid", data.get("has_seal", True)) is True if exists else False
         result.integrity_pledge.owner_id_number_valid = data.get("owner_id_number_valid", data.get("id_number_ok", True)) is not False
@@ -2275,11 +2420,10 @@ JSON만 출력하세요."""
     
     def _apply_lh_confirm(self, result: PublicHousingReviewResult, data: Dict):
         """공사직원여부 확인서 적용. 문서가 있으면 기본적으로 유효하게 처리 (있는 것을 없다고 하지 않음)."""
-        result.lh_employee_confirmation.exists = data.get("exists", True)
-        result.lh_employee_confirmation.status = DocumentStatus.VALID
+        self._apply_common(result.lh_employee_confirmation, data)
         
         # 소유자 이름 추출
-        lh_name = self._get_first(data, "owner_name", "name", "소유자")
+        lh_name = self._first(data, _LH_OWNER_NAME_ALIASES)
         app_name = result.housing_sale_application.owner_info.name
         
         # 이름 비교 로직 개선
@@ -2308,7 +2452,7 @@ JSON만 출력하세요."""
             result.lh_employee_confirmation.seal_valid = True
         
         # 작성일자
-        wd = self._get_first(data, "written_date", "작성일", "issue_date")
+        wd = self._written_date(data)
         if wd:
             result.lh_employee_confirmation.written_date = str(wd).strip()
         
@@ -2332,17 +2476,29 @@ JSON만 출력하세요."""
             # 본인발급용 인감증명서
             result.owner_identity.seal_certificate.exists = exists
             result.owner_identity.seal_certificate.status = DocumentStatus.VALID
-            issue_d = self._get_first(data, "issue_date", "발급일", "작성일")
+            issue_d = self._first(data, _ISSUE_DATE_ALIASES)
             if issue_d:
                 result.owner_identity.seal_certificate.issue_date = str(issue_d).strip()
                 result.owner_identity.seal_certificate_issue_date = str(issue_d).strip()
             # 인감 검증에도 적용
             result.housing_sale_application.seal_verification.certificate_exists = True
     
+    def _apply_agent_id_card(self, result: PublicHousingReviewResult, data: Dict):
+        """대리인신분증사본 적용. 있으면 제출·이름 일치된 것으로 간주"""
+        if data.get("exists", True):
+            result.housing_sale_application.agent_info.exists = True
+            result.housing_sale_application.agent_info.id_card_match = True
+    
+    def _apply_business_registration(self, result: PublicHousingReviewResult, data: Dict):
+        """🔥 사업자등록증 적용 (법인 서류)"""
+        if data.get("exists", True):
+            result.corporate_documents.business_registration.exists = True
+            result.corporate_documents.is_corporation = True
+            print(f"    [법인 서류 감지] 사업자등록증 발견 → is_corporation=True")
+    
     def _apply_building_ledger_summary(self, result: PublicHousingReviewResult, data: Dict):
         """건축물대장 총괄표제부 적용. 한 필지 2개 이상 동일 때 받는 서류. 내진설계·사용승인일 등은 표제부에서만 검토하므로 여기서는 설정하지 않음."""
-        result.building_ledger_summary.exists = data.get("exists", True)
-        result.building_ledger_summary.status = DocumentStatus.VALID
+        self._apply_common(result.building_ledger_summary, data)
         result.building_ledger_summary.required = True  # 총괄표제부가 제출됐다 = 한 필지에 2개 이상 동이 있다는 의미
         bc = data.get("building_count", data.get("동수", data.get("building_count", 2)))
         if bc is not None:
@@ -2353,10 +2509,9 @@ JSON만 출력하세요."""
 
     def _apply_building_ledger_title(self, result: PublicHousingReviewResult, data: Dict):
         """건축물대장 표제부 적용. 내진설계·사용승인일 등은 이 표제부 데이터로만 검토함."""
-        result.building_ledger_title.exists = data.get("exists", True)
-        result.building_ledger_title.status = DocumentStatus.VALID
+        self._apply_common(result.building_ledger_title, data)
         
-        app_d = self._get_first(data, "approval_date", "사용승인일", "승인일", "use_approval_date")
+        app_d = self._first(data, _REGISTRY_APPROVAL_DATE_ALIASES)
         if app_d:
             result.building_ledger_title.approval_date = str(app_d).strip()
         
@@ -2403,8 +2558,7 @@ JSON만 출력하세요."""
     
     def _apply_building_ledger_exclusive(self, result: PublicHousingReviewResult, data: Dict):
         """건축물대장 전유부 적용. 호별 면적 있으면 units에 반영 (reconcile에서 비교용)."""
-        result.building_ledger_exclusive.exists = data.get("exists", True)
-        result.building_ledger_exclusive.status = DocumentStatus.VALID
+        self._apply_common(result.building_ledger_exclusive, data)
         units = data.get("units", [])
         print(f"    [전유부] API 반환 호수: {len(units)}개")
         if units:
@@ -2421,23 +2575,26 @@ JSON만 출력하세요."""
     
     def _apply_building_layout(self, result: PublicHousingReviewResult, data: Dict):
         """건축물현황도 적용. 문서가 있으면 배치도·층별·호별·지자체발급은 기본 true(있는 것으로 간주)."""
-        result.building_layout_plan.exists = data.get("exists", True)
-        result.building_layout_plan.status = DocumentStatus.VALID
         # 문서 있으면 기본값 true. AI가 명시적으로 false만 반환했을 때만 false.
-        exists = result.building_layout_plan.exists
+        exists = self._apply_common(result.building_layout_plan, data)
         result.building_layout_plan.has_site_plan = data.get("has_site_plan", data.get("site_plan", True)) is True if exists else False
         result.building_layout_plan.has_all_floor_plans = data.get("has_all_floor_plans", data.get("floor_plans", True)) is True if exists else False
         result.building_layout_plan.has_unit_plans = data.get("has_unit_plans", data.get("unit_plans", True)) is True if exists else False
         result.building_layout_plan.is_government_issued = data.get("is_government_issued", data.get("government_issued", True)) is True if exists else False
     
+    @staticmethod
+    def _coerce_bool(data: Dict, key: str, alias: str, default: bool = True) -> bool:
+        """data[key] → data[alias] → default 순으로 값을 찾아 bool로 변환 (AI가 명시한 값 우선)"""
+        v = data[key] if key in data else data.get(alias, default)
+        return v if isinstance(v, bool) else bool(v)
+    
     def _apply_land_ledger(self, result: PublicHousingReviewResult, data: Dict):
         """토지대장 적용. 문서 있으면 필지·대지면적은 있는 것으로 간주(기본 true)."""
-        result.land_ledger.exists = data.get("exists", True)
-        result.land_ledger.status = DocumentStatus.VALID
-        la = self._parse_float(self._get_first(data, "land_area", "면적", "대지면적"))
+        self._apply_common(result.land_ledger, data)
+        la = self._parse_float(self._first(data, _LAND_AREA_ALIASES))
         if la is not None:
             result.land_ledger.land_area = la
-        issue = self._get_first(data, "issue_date", "발급일", "작성일")
+        issue = self._first(data, _ISSUE_DATE_ALIASES)
         if issue:
             result.land_ledger.issue_date = str(issue).strip()
         lc = self._get_first(data, "land_category", "지목", "지목명")
@@ -2450,27 +2607,16 @@ JSON만 출력하세요."""
             result.land_ledger.use_restrictions = [restrictions.strip()]
         # 문서 있으면 필지 전부 제출된 것으로 간주. AI가 명시적으로 false만 반환했을 때만 false.
         exists = result.land_ledger.exists
-        result.land_ledger.all_parcels_submitted = (
-            data.get("all_parcels_submitted") if "all_parcels_submitted" in data
-            else (data.get("all_parcels") if "all_parcels" in data else True)
-        ) if exists else False
-        if not isinstance(result.land_ledger.all_parcels_submitted, bool):
-            result.land_ledger.all_parcels_submitted = bool(result.land_ledger.all_parcels_submitted)
+        result.land_ledger.all_parcels_submitted = self._coerce_bool(data, "all_parcels_submitted", "all_parcels") if exists else False
     
     def _apply_land_use_plan(self, result: PublicHousingReviewResult, data: Dict):
         """토지이용계획확인원 적용. 문서 있으면 필지·대지면적 있는 것으로 간주(기본 true)."""
-        result.land_use_plan.exists = data.get("exists", True)
-        result.land_use_plan.status = DocumentStatus.VALID
-        la_plan = self._parse_float(self._get_first(data, "land_area", "면적", "대지면적"))
+        self._apply_common(result.land_use_plan, data)
+        la_plan = self._parse_float(self._first(data, _LAND_AREA_ALIASES))
         if la_plan is not None:
             result.land_use_plan.land_area = la_plan
         exists = result.land_use_plan.exists
-        result.land_use_plan.all_parcels_submitted = (
-            data.get("all_parcels_submitted") if "all_parcels_submitted" in data
-            else (data.get("all_parcels") if "all_parcels" in data else True)
-        ) if exists else False
-        if isinstance(result.land_use_plan.all_parcels_submitted, bool) is False:
-            result.land_use_plan.all_parcels_submitted = bool(result.land_use_plan.all_parcels_submitted)
+        result.land_use_plan.all_parcels_submitted = self._coerce_bool(data, "all_parcels_submitted", "all_parcels") if exists else False
         if "is_redevelopment_zone" in data:
             result.land_use_plan.is_redevelopment_zone = data["is_redevelopment_zone"]
         if "is_maintenance_zone" in data:
@@ -2482,15 +2628,8 @@ JSON만 출력하세요."""
     
     def _apply_building_registry(self, result: PublicHousingReviewResult, data: Dict):
         """건물등기부등본 적용. 문서 있으면 호수 전부 있는 것으로 간주(기본 true)."""
-        result.building_registry.exists = data.get("exists", True)
-        result.building_registry.status = DocumentStatus.VALID
-        exists = result.building_registry.exists
-        result.building_registry.all_units_submitted = (
-            data.get("all_units_submitted") if "all_units_submitted" in data
-            else (data.get("all_units") if "all_units" in data else True)
-        ) if exists else False
-        if not isinstance(result.building_registry.all_units_submitted, bool):
-            result.building_registry.all_units_submitted = bool(result.building_registry.all_units_submitted)
+        exists = self._apply_common(result.building_registry, data)
+        result.building_registry.all_units_submitted = self._coerce_bool(data, "all_units_submitted", "all_units") if exists else False
         if "has_seizure" in data:
             result.building_registry.has_seizure = data["has_seizure"]
         if "has_mortgage" in data:
@@ -2504,55 +2643,54 @@ JSON만 출력하세요."""
     
     def _apply_land_registry(self, result: PublicHousingReviewResult, data: Dict):
         """토지등기부등본 적용. 문서 있으면 필지 전부 있는 것으로 간주(기본 true)."""
-        result.land_registry.exists = data.get("exists", True)
-        result.land_registry.status = DocumentStatus.VALID
-        exists = result.land_registry.exists
-        result.land_registry.all_parcels_submitted = (
-            data.get("all_parcels_submitted") if "all_parcels_submitted" in data
-            else (data.get("all_parcels") if "all_parcels" in data else True)
-        ) if exists else False
-        if not isinstance(result.land_registry.all_parcels_submitted, bool):
-            result.land_registry.all_parcels_submitted = bool(result.land_registry.all_parcels_submitted)
+        exists = self._apply_common(result.land_registry, data)
+        result.land_registry.all_parcels_submitted = self._coerce_bool(data, "all_parcels_submitted", "all_parcels") if exists else False
     
     # 플레이스홀더로 간주해 제외할 값 (실제 도면 자재명이 아님)
     _AS_BUILT_PLACEHOLDERS = ("자재명", "미확인", "추출 필요", "추출필요", "없음", "-", "null", "none", "?")
+    _PLACEHOLDER_SET = frozenset(p.lower() for p in _AS_BUILT_PLACEHOLDERS)
+    # 이보다 긴 문자열은 플레이스홀더 부분일치(len(ph) + 2 이내) 대상이 될 수 없음
+    _PLACEHOLDER_MAX_LEN = max(len(p) for p in _AS_BUILT_PLACEHOLDERS) + 2
 
     def _is_real_material(self, val: Optional[str]) -> bool:
-        if not val or not str(val).strip():
+        if not val:
             return False
-        s = str(val).strip().lower()
-        if s in ("null", "none", "-", "없음"):
+        s = (val if isinstance(val, str) else str(val)).strip().lower()
+        if not s or s in self._PLACEHOLDER_SET:
             return False
-        for ph in self._AS_BUILT_PLACEHOLDERS:
-            if ph in s and len(s) <= len(ph) + 2:
-                return False
+        if len(s) <= self._PLACEHOLDER_MAX_LEN:
+            for ph in self._PLACEHOLDER_SET:
+                if ph in s and len(s) <= len(ph) + 2:
+                    return False
         return True
 
     def _apply_as_built_drawing(self, result: PublicHousingReviewResult, data: Dict):
         """준공도면 적용 (규칙 29). 도면에서 읽은 실제 자재명만 반영."""
-        result.as_built_drawing.exists = data.get("exists", True)
-        result.as_built_drawing.status = DocumentStatus.VALID
-        result.as_built_drawing.materials_extracted = data.get("materials_extracted", False)
-        ext_finish = self._get_first(data, "exterior_finish_material", "외벽마감", "외벽마감재료")
-        if ext_finish and self._is_real_material(ext_finish):
-            result.as_built_drawing.exterior_finish_material = str(ext_finish).strip()
-        ext_insul = self._get_first(data, "exterior_insulation_material", "외벽단열", "외벽단열재료")
-        if ext_insul and self._is_real_material(ext_insul):
-            result.as_built_drawing.exterior_insulation_material = str(ext_insul).strip()
-        piloti_f = self._get_first(data, "piloti_finish_material", "필로티마감", "필로티마감재료")
-        if piloti_f and self._is_real_material(piloti_f):
-            result.as_built_drawing.piloti_finish_material = str(piloti_f).strip()
-        piloti_i = self._get_first(data, "piloti_insulation_material", "필로티단열", "필로티단열재료")
-        if piloti_i and self._is_real_material(piloti_i):
-            result.as_built_drawing.piloti_insulation_material = str(piloti_i).strip()
-        if any([
-            result.as_built_drawing.exterior_finish_material,
-            result.as_built_drawing.exterior_insulation_material,
-            result.as_built_drawing.piloti_finish_material,
-            result.as_built_drawing.piloti_insulation_material,
-        ]):
-            result.as_built_drawing.materials_extracted = True
+        self._apply_common(result.as_built_drawing, data)
+        drawing = result.as_built_drawing
+        drawing.materials_extracted = data.get("materials_extracted", False)
+        for field_name, aliases in _AS_BUILT_MATERIAL_ALIASES.items():
+            v = self._first(data, aliases)
+            if v and self._is_real_material(v):
+                setattr(drawing, field_name, str(v).strip())
+        if any(getattr(drawing, f) for f in _AS_BUILT_MATERIAL_ALIASES):
+            drawing.materials_extracted = True
     
+    @staticmethod
+    def _extend_materials(target: List[str], data: Dict):
+        """자재명(단일 또는 리스트)을 순서를 유지하며 중복 없이 target에 추가 (set으로 O(1) 중복 확인)"""
+        mat = data.get("material_name") or data.get("대상자재") or data.get("자재명")
+        if mat is None:
+            return
+        seen = set(target)
+        for m in (mat if isinstance(mat, list) else (mat,)):
+            if not m:
+                continue
+            sm = str(m).strip()
+            if sm and sm not in seen:
+                seen.add(sm)
+                target.append(sm)
+
     def _apply_test_certificate(self, result: PublicHousingReviewResult, data: Dict):
         """시험성적서 적용 (규칙 30). 
         ★ 핵심: 열방출시험 + 가스유해성 시험 둘 다 있어야 유효
@@ -2582,46 +2720,13 @@ JSON만 출력하세요."""
         # AI가 놓칠 수 있는 시험 항목을 텍스트 분석으로 보완
         detected_text = " ".join([str(d).lower() for d in detected]) if detected else ""
         
-        # 열방출시험 키워드 (대소문자 무시)
-        heat_keywords = [
-            "열방출", "총열방출량", "열방출률", "열방출율", "열량방출",
-            "thr", "total heat release", "heat release rate", "hrr",
-            "발열량", "발열율", "열에너지",
-            "cone calorimeter", "콘칼로리미터",
-            "5660", "iso 5660", "ks f iso 5660"
-        ]
-        
-        # 가스유해성시험 키워드 (대소문자 무시)
-        gas_keywords = [
-            "가스유해성", "가스유해", "가스독성", "연소가스유해성", "연소가스",
-            "gas toxicity", "gas toxic", "toxicity test",
-            "유해가스", "유독가스", "연기독성", "연기유해성",
-            "2271", "ks f 2271",
-            "마우스", "mouse", "동물시험"
-        ]
-        
-        # 열전도율시험 키워드 (제외 대상)
-        thermal_keywords = [
-            "열전도율", "열전도", "열전도계수", "단열성능", "단열시험",
-            "thermal conductivity", "k-value", "k값",
-            "8302", "ks l iso 8302", "9016", "ks l 9016"
-        ]
-        
         # 텍스트 기반 추가 검출 (OR 조건으로 병합)
-        for kw in heat_keywords:
-            if kw.lower() in detected_text:
-                has_heat = True
-                break
-        
-        for kw in gas_keywords:
-            if kw.lower() in detected_text:
-                has_gas = True
-                break
-        
-        for kw in thermal_keywords:
-            if kw.lower() in detected_text:
-                has_thermal = True
-                break
+        # AI가 이미 true로 판정한 분류는 텍스트 스캔 대상에서 제외
+        known = frozenset(cat for cat, flag in (("heat", has_heat), ("gas", has_gas), ("thermal", has_thermal)) if flag)
+        matched = _scan_test_cert_keywords(detected_text, known)
+        has_heat = "heat" in matched
+        has_gas = "gas" in matched
+        has_thermal = "thermal" in matched
         
         # ========================================
         # 3단계: 최종 결과 적용
@@ -2634,56 +2739,94 @@ JSON만 출력하세요."""
         # 4단계: 검증 결과 로깅
         # ========================================
         if detected:
-            print(f"[시험성적서] 감지된 시험 항목: {', '.join(detected)}")
+            logger.info("[시험성적서] 감지된 시험 항목: %s", ", ".join(map(str, detected)))
         
         # 유효성 판정 로깅
         if has_heat and has_gas:
-            print(f"[시험성적서] ✅ 유효: 열방출시험 + 가스유해성 시험 둘 다 있음")
+            logger.info("[시험성적서] ✅ 유효: 열방출시험 + 가스유해성 시험 둘 다 있음")
         elif has_thermal and not has_heat and not has_gas:
-            print(f"[시험성적서] ❌ 무효: 열전도율 시험만 있음 (열방출+가스유해성 필요)")
+            logger.info("[시험성적서] ❌ 무효: 열전도율 시험만 있음 (열방출+가스유해성 필요)")
         else:
             missing = []
             if not has_heat:
                 missing.append("열방출시험")
             if not has_gas:
                 missing.append("가스유해성 시험")
-            print(f"[시험성적서] ❌ 무효: {', '.join(missing)} 없음")
+            logger.info("[시험성적서] ❌ 무효: %s 없음", ", ".join(missing))
         
         # ========================================
         # 5단계: 자재명 및 납품확인서 처리
         # ========================================
         if not result.test_certificate_delivery.has_delivery_confirmation:
-            result.test_certificate_delivery.has_delivery_confirmation = data.get("has_delivery_confirmation", False) is True
-        mat = data.get("material_name") or data.get("대상자재") or data.get("자재명")
-        if mat is not None:
-            if isinstance(mat, list):
-                for m in mat:
-                    if m and str(m).strip() and str(m).strip() not in result.test_certificate_delivery.materials_with_test_cert:
-                        result.test_certificate_delivery.materials_with_test_cert.append(str(m).strip())
-            elif str(mat).strip() and str(mat).strip() not in result.test_certificate_delivery.materials_with_test_cert:
-                result.test_certificate_delivery.materials_with_test_cert.append(str(mat).strip())
+            result.test_certificate_delivery.has_delivery_confirmation = bool(data.get("has_delivery_confirmation", False))
+        self._extend_materials(result.test_certificate_delivery.materials_with_test_cert, data)
 
     def _apply_delivery_confirmation(self, result: PublicHousingReviewResult, data: Dict):
         """납품확인서 적용 (규칙 30). 자재별 납품확인서 미비 보고용 materials_with_delivery_conf 수집."""
         result.test_certificate_delivery.exists = True
         result.test_certificate_delivery.status = DocumentStatus.VALID
-        result.test_certificate_delivery.has_delivery_confirmation = data.get("exists", data.get("has_delivery_confirmation", True)) is True
+        result.test_certificate_delivery.has_delivery_confirmation = bool(data.get("exists", data.get("has_delivery_confirmation", True)))
         # ★ 납품확인서 파일이 실제로 제출되었음을 표시
         result.test_certificate_delivery.delivery_conf_file_exists = True
-        mat = data.get("material_name") or data.get("대상자재") or data.get("자재명")
-        if mat is not None:
-            if isinstance(mat, list):
-                for m in mat:
-                    if m and str(m).strip() and str(m).strip() not in result.test_certificate_delivery.materials_with_delivery_conf:
-                        result.test_certificate_delivery.materials_with_delivery_conf.append(str(m).strip())
-            elif str(mat).strip() and str(mat).strip() not in result.test_certificate_delivery.materials_with_delivery_conf:
-                result.test_certificate_delivery.materials_with_delivery_conf.append(str(mat).strip())
+        self._extend_materials(result.test_certificate_delivery.materials_with_delivery_conf, data)
 
 
 # =============================================================================
 # 기존 인터페이스 호환
 # =============================================================================
 
+# 폴백 분석기 모듈은 첫 사용 시 1회만 import (이후 호출은 캐시된 클래스/함수 재사용)
+@functools.lru_cache(maxsize=None)
+def _get_single_shot_cls():
+    from core.single_shot_analyzer import SingleShotPDFAnalyzer
+    return SingleShotPDFAnalyzer
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fast_fn():
+    from core.async_parallel_analyzer import analyze_pdf_fast
+    return analyze_pdf_fast
+
+
+@functools.lru_cache(maxsize=None)
+def _get_precision_cls():
+    from core.precision_pdf_analyzer import PrecisionPDFAnalyzer
+    return PrecisionPDFAnalyzer
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ultra_cls():
+    from core.ultra_unified_pdf_analyzer import UltraUnifiedPDFAnalyzer
+    return UltraUnifiedPDFAnalyzer
+
+
+@functools.lru_cache(maxsize=None)
+def _get_owner_extractor(provider: str, model_name: Optional[str]):
+    """소유자 전용 추출기 — PDF 간 상태가 없으므로 (provider, model) 별 인스턴스 재사용 (API 클라이언트 초기화 1회)"""
+    from core.owner_info_extractor import OwnerInfoExtractor
+    return OwnerInfoExtractor(provider=provider, model_name=model_name)
+
+
+# 소유자 전용 추출 결과에서 소유자 정보로 옮겨 담는 필드
+_OWNER_RESULT_FIELDS = ("name", "birth_date", "address", "phone", "email")
+
+# 소유자 추출 캐시 키용 앞부분 크기 (앞 64KB + 파일 크기로 동일 PDF 판별)
+_OWNER_CACHE_HEAD_BYTES = 65536
+
+
+def _pdf_content_key(pdf_path: str) -> Tuple[str, int]:
+    """PDF 내용 기반 캐시 키 (앞 64KB SHA1, 파일 크기)"""
+    with open(pdf_path, "rb") as f:
+        head = f.read(_OWNER_CACHE_HEAD_BYTES)
+    return hashlib.sha1(head).hexdigest(), os.path.getsize(pdf_path)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_owner_extract(content_key: Tuple[str, int], provider: str, model_name: Optional[str], pdf_path: str):
+    """동일 PDF 재분석(재시도·폴백) 시 소유자 전용 Vision 호출을 생략 (LRU로 메모리 상한)"""
+    return _get_owner_extractor(provider, model_name).extract_from_pdf(pdf_path)
+
+
 def analyze_pdf_unified(
     pdf_path: str,
     announcement_date: str = "2025-07-05",
@@ -2726,8 +2869,7 @@ def analyze_pdf_unified(
     # ★★★ v3.0: SingleShot 모드 — 1회 API 호출로 전체 분석 (최우선) ★★★
     if single_shot:
         try:
-            from core.single_shot_analyzer import SingleShotPDFAnalyzer
-            analyzer = SingleShotPDFAnalyzer(provider=provider, model_name=model_name)
+            analyzer = _get_single_shot_cls()(provider=provider, model_name=model_name)
             result, meta = analyzer.analyze(pdf_path, announcement_date)
             print(f"\n[SingleShot] ★ API 1회 호출로 분석 완료!")
         except ImportError as ie:
@@ -2741,8 +2883,7 @@ def analyze_pdf_unified(
     # 폴백 1: 초고속 모드 (이중검증)
     if result is None and fast_mode:
         try:
-            from core.async_parallel_analyzer import analyze_pdf_fast
-            result, meta = analyze_pdf_fast(
+            result, meta = _get_fast_fn()(
                 pdf_path, 
                 announcement_date, 
                 provider=provider or "gemini",
@@ -2755,16 +2896,14 @@ def analyze_pdf_unified(
     # 폴백 2: PrecisionAnalyzer
     if result is None and precision_mode:
         try:
-            from core.precision_pdf_analyzer import PrecisionPDFAnalyzer
-            analyzer = PrecisionPDFAnalyzer(provider=provider, model_name=model_name)
+            analyzer = _get_precision_cls()(provider=provider, model_name=model_name)
             result, meta = analyzer.analyze(pdf_path, announcement_date)
         except ImportError:
             pass
     
     # 폴백 3: 레거시
     if result is None:
-        from core.ultra_unified_pdf_analyzer import UltraUnifiedPDFAnalyzer
-        analyzer = UltraUnifiedPDFAnalyzer(provider=provider, model_name=model_name)
+        analyzer = _get_ultra_cls()(provider=provider, model_name=model_name)
         result, meta = analyzer.analyze(pdf_path, announcement_date)
     
     # ★★★ 조건부 소유자 전용 추출기 (SingleShot에서 이미 포함, 대부분 SKIP) ★★★
@@ -2773,40 +2912,33 @@ def analyze_pdf_unified(
         owner_name_exists = bool(owner.name and str(owner.name).strip())
         
         if owner_name_exists:
-            print(f"\n[소유자 추출] ★ 이미 추출됨 (이름: {owner.name}) → 전용 추출기 SKIP")
+            logger.info("[소유자 추출] ★ 이미 추출됨 (이름: %s) → 전용 추출기 SKIP", owner.name)
         else:
-            print("\n[소유자 전용 추출기] 소유자 정보 부족 → 추출기 호출")
+            logger.info("[소유자 전용 추출기] 소유자 정보 부족 → 추출기 호출")
             try:
-                from core.owner_info_extractor import OwnerInfoExtractor
-                extractor = OwnerInfoExtractor(provider=provider, model_name=model_name)
-                owner_result = extractor.extract_from_pdf(pdf_path)
+                owner_result = _cached_owner_extract(
+                    _pdf_content_key(pdf_path), provider, model_name, pdf_path
+                )
                 
-                if owner_result.name:
-                    owner.name = owner_result.name
-                if owner_result.birth_date:
-                    owner.birth_date = owner_result.birth_date
-                if owner_result.address:
-                    owner.address = owner_result.address
-                if owner_result.phone:
-                    owner.phone = owner_result.phone
-                if owner_result.email:
-                    owner.email = owner_result.email
+                for f in _OWNER_RESULT_FIELDS:
+                    v = getattr(owner_result, f)
+                    if v:
+                        setattr(owner, f, v)
                 if owner_result.is_corporation:
                     result.corporate_documents.is_corporation = True
                 if owner_result.has_seal:
                     result.housing_sale_application.seal_verification.seal_exists = True
                 
-                new_filled = sum([
-                    bool(owner.name and str(owner.name).strip()),
-                    bool(owner.birth_date and str(owner.birth_date).strip()),
-                    bool(owner.address and str(owner.address).strip()),
-                    bool(owner.phone and str(owner.phone).strip()),
-                    bool(owner.email and str(owner.email).strip()),
-                ])
+                # 채워진 필드를 비트마스크로 모아 popcount (리스트·중간 합산 없음)
+                filled_mask = 0
+                for i, f in enumerate(_OWNER_RESULT_FIELDS):
+                    if str(getattr(owner, f) or "").strip():
+                        filled_mask |= 1 << i
+                new_filled = filled_mask.bit_count()
                 owner.is_complete = new_filled >= 3
-                print(f"  소유자 정보 {new_filled}/5 채워짐")
+                logger.info("  소유자 정보 %d/5 채워짐", new_filled)
             except Exception as e:
-                print(f"  [전용 추출기 오류] {e}")
+                logger.warning("  [전용 추출기 오류] %s", e)
     
     _elapsed = _time.time() - _t0
     print(f"\n★★★ [analyze_pdf_unified v3.0] 전체 소요: {_elapsed:.1f}초 ★★★\n")
@@ -128,6 +128,235 @@ def test_date_validity():
     print()
 
 
+# 임대현황 vs 전유부 호별 면적 비교 테스트
+def test_rental_unit_area_comparison():
+    """호수 누락·면적 0인 호는 비교에서 제외되는지 테스트"""
+    from core.unified_pdf_analyzer import UnifiedPDFAnalyzer
+    from core.data_models import PublicHousingReviewResult, UnitInfo, ExclusiveUnit
+    
+    print("=" * 60)
+    print("테스트 4: 임대현황 vs 전유부 호별 면적 비교")
+    print("=" * 60)
+    
+    # AI 클라이언트 없이 비교 로직만 검증
+    analyzer = UnifiedPDFAnalyzer.__new__(UnifiedPDFAnalyzer)
+    
+    test_cases = [
+        (
+            [UnitInfo(unit_number="101", exclusive_area=59.9), UnitInfo(unit_number="102", exclusive_area=84.9)],
+            [ExclusiveUnit(unit_number="101", exclusive_area=59.9), ExclusiveUnit(unit_number="102", exclusive_area=84.0)],
+            ["102"],
+            "면적 다른 호만 불일치",
+        ),
+        (
+            [UnitInfo(unit_number="", exclusive_area=70.0)],
+            [ExclusiveUnit(unit_number="", exclusive_area=84.0), ExclusiveUnit(unit_number="", exclusive_area=59.9)],
+            [],
+            "호수 누락된 호끼리는 비교하지 않음",
+        ),
+        (
+            [UnitInfo(unit_number="101", exclusive_area=0.0)],
+            [ExclusiveUnit(unit_number="101", exclusive_area=59.9)],
+            [],
+            "임대현황 면적 0은 미추출로 간주",
+        ),
+    ]
+    
+    for rent_units, excl_units, expected, description in test_cases:
+        result = PublicHousingReviewResult(review_date="2025-07-04")
+        result.rental_status.units = rent_units
+        result.building_ledger_exclusive.units = excl_units
+        analyzer._reconcile_result(result, "2025-07-04")
+        actual = result.rental_status.mismatched_units
+        status = "✅ PASS" if actual == expected else "❌ FAIL"
+        print(f"{status} {description}")
+        print(f"   기대값: {expected}")
+        print(f"   실제값: {actual}")
+        print()
+    
+    print()
+
+
+# 숫자 추출 테스트 (OCR 띄어쓰기)
+def test_extract_number():
+    """콤마·공백이 섞인 값에서 숫자 추출 테스트"""
+    from core.advanced_validator import AdvancedValidator
+    
+    print("=" * 60)
+    print("테스트 5: 숫자 추출 (콤마·공백)")
+    print("=" * 60)
+    
+    validator = AdvancedValidator("2025-07-04")
+    
+    test_cases = [
+        ("84.5㎡", 84.5, "일반 면적"),
+        ("84. 5㎡", 84.5, "소수점 뒤 공백"),
+        ("1 234", 1234.0, "공백 천 단위"),
+        ("1,234.5", 1234.5, "콤마 천 단위"),
+        ("12,34", 1234.0, "비정규 콤마"),
+        ("면적 없음", None, "숫자 없음"),
+    ]
+    
+    for text, expected, description in test_cases:
+        result = validator._extract_number(text)
+        status = "✅ PASS" if result == expected else "❌ FAIL"
+        print(f"{status} {description}")
+        print(f"   입력: {text}")
+        print(f"   기대값: {expected}")
+        print(f"   실제값: {result}")
+        print()
+    
+    print()
+
+
+# 신청인 유형(법인) 표시 테스트
+def test_applicant_type_from_owner_name():
+    """법인 형태 키워드가 있는 소유자명만 법인 신청인으로 표시되는지 테스트"""
+    from core.unified_pdf_analyzer import UnifiedPDFAnalyzer
+    from core.data_models import PublicHousingReviewResult, ApplicantType
+    
+    print("=" * 60)
+    print("테스트 6: 소유자명 기반 신청인 유형")
+    print("=" * 60)
+    
+    # AI 클라이언트 없이 적용 로직만 검증
+    analyzer = UnifiedPDFAnalyzer.__new__(UnifiedPDFAnalyzer)
+    analyzer._detected_corp_from_text = False
+    
+    test_cases = [
+        ("(주)대한건설", True, "법인 형태 키워드"),
+        ("한양주택조합", True, "조합"),
+        ("김상호", False, "개인명 ('상호' 포함)"),
+        ("박종합", False, "개인명 ('종합' 포함)"),
+        ("이재단", False, "개인명 ('재단' 포함)"),
+        ("최시행", False, "개인명 ('시행' 포함)"),
+    ]
+    
+    for name, expected, description in test_cases:
+        result = PublicHousingReviewResult(review_date="2025-07-04")
+        analyzer._apply_housing_application(result, {"exists": True, "owner_name": name})
+        actual = result.applicant_type == ApplicantType.CORPORATION
+        status = "✅ PASS" if actual == expected else "❌ FAIL"
+        print(f"{status} {description}")
+        print(f"   소유자명: {name}")
+        print(f"   기대값: {expected}, 실제값: {actual}")
+        print()
+    
+    print()
+
+
+# 공고문 파서 추출 테스트
+def test_announcement_parser_extractors():
+    """공고문 파서 정규식·항목 분리 결과 테스트"""
+    from core.announcement_parser import AnnouncementPDFParser
+    
+    print("=" * 60)
+    print("테스트 7: 공고문 파서 추출")
+    print("=" * 60)
+    
+    parser = AnnouncementPDFParser()
+    
+    text = (
+        "2025년도 경기남부지역 기존주택 매입 공고\n"
+        "신청기간 : 2025.3.10 ~ 2025.3.20\n"
+        "다가구 다세대 오피스텔 15호 이상 건물\n"
+        "일반가구용 전용 20㎡ ~ 85\n"
+        "청년 전용 16㎡ ~ 60\n"
+        "신혼부부 전용 36 ～ 85\n"
+        "다자녀 전용 46㎡ ~ 85\n"
+        "착공일이 '09.1.1 이후 사용승인일이 2015.01.01\n"
+    )
+    exclusion_text = (
+        "매입제외주택\n"
+        "① 주택 지리적 (가) 철도 인접 (나) 고압선\n 인접 "
+        "② 주택여건 (가) 불법 건축물 "
+        "③ 기타사항 (가) 소송 중 (나) 기타(괄호) 포함\n"
+        "3 신청접수 (가) 섹션 밖 항목"
+    )
+    body = "본문 " * 600  # 끝부분 탐색 구간(1KB)보다 긴 본문
+    
+    test_cases = [
+        ("제목", parser._extract_title(text), "2025년도 경기남부지역 기존주택 매입 공고"),
+        ("신청 시작일", parser._extract_date(text, "시작"), "2025-03-10"),
+        ("신청 마감일", parser._extract_date(text, "마감"), "2025-03-20"),
+        ("공고일 (문서 끝)", parser._extract_date(body + "\n2025. 7. 4.\n", "공고"), "2025-07-04"),
+        ("공고일 (문서 앞, 끝에 없음)", parser._extract_date("공고일: 2024.5.6\n" + body, "공고"), "2024-05-06"),
+        ("주택 유형 (중복 제거·고정 순서)", parser._extract_housing_types(text), ["다가구", "공동주택", "주거용오피스텔"]),
+        ("최소 호수", parser._extract_min_units(text), 15),
+        ("전용면적 기준", parser._extract_area_criteria(text), {
+            "일반": {"min": 20, "max": 85},
+            "청년": {"min": 16, "max": 60},
+            "신혼신생아": {"min": 36, "max": 85},
+            "다자녀": {"min": 46, "max": 85},
+        }),
+        ("착공·사용승인 기준", parser._extract_construction_criteria(text), {
+            "min_construction_start": "2009-01-01",
+            "min_approval_date": "2015-01-01",
+        }),
+        # 본문에 괄호가 있는 항목도 유지 (이전에는 "(" 이후 누락되어 항목이 빠졌음)
+        ("매입제외 항목", parser._extract_exclusion_sections(exclusion_text), {
+            "지리적_요건": ["(가) 철도 인접", "(나) 고압선 인접"],
+            "주택_요건": ["(가) 불법 건축물"],
+            "기타_요건": ["(가) 소송 중", "(나) 기타(괄호) 포함"],
+        }),
+        ("매입제외 섹션 없음", parser._extract_exclusion_sections("매입 안내 본문 (가) 항목"), {
+            "지리적_요건": [], "주택_요건": [], "기타_요건": [],
+        }),
+        ("항목 분리 (괄호 포함)", parser._split_into_items("(가) 철도 인접 (나) 고압선(154kV) 인접 (다) 기타"),
+         ["(가) 철도 인접", "(나) 고압선(154kV) 인접", "(다) 기타"]),
+    ]
+    
+    for description, result, expected in test_cases:
+        status = "✅ PASS" if result == expected else "❌ FAIL"
+        print(f"{status} {description}")
+        print(f"   기대값: {expected}")
+        print(f"   실제값: {result}")
+        print()
+    
+    print()
+
+
+# 신뢰도 수준 테스트
+def test_confidence_level():
+    """ConfidenceLevel 정수 순서·표시 명칭·리포트 직렬화 테스트"""
+    from core.advanced_validator import AdvancedValidator, ConfidenceLevel, ValidationItem
+    
+    print("=" * 60)
+    print("테스트 8: 신뢰도 수준 (ConfidenceLevel)")
+    print("=" * 60)
+    
+    levels = [ConfidenceLevel.HIGH, ConfidenceLevel.LOW, ConfidenceLevel.MANUAL_CHECK, ConfidenceLevel.MEDIUM]
+    
+    validator = AdvancedValidator("2025-07-04")
+    for i, level in enumerate(levels):
+        validator.add_validation(ValidationItem(
+            field_name=f"필드{i}",
+            extracted_value="값",
+            is_valid=level is not ConfidenceLevel.MANUAL_CHECK,
+            confidence=level,
+            validation_method="정규식",
+        ))
+    report = validator.generate_report()
+    
+    test_cases = [
+        ("낮은 신뢰도 < 높은 신뢰도", ConfidenceLevel.MANUAL_CHECK < ConfidenceLevel.LOW < ConfidenceLevel.MEDIUM < ConfidenceLevel.HIGH, True),
+        ("최저 신뢰도 집계 (min)", min(levels), ConfidenceLevel.MANUAL_CHECK),
+        ("표시 명칭", [c.label for c in levels], ["높음", "낮음", "수동확인필요", "중간"]),
+        ("리포트 신뢰도는 한글 명칭", [v["confidence"] for v in report["all_validations"]], ["높음", "낮음", "수동확인필요", "중간"]),
+        ("수동확인 항목", [v["field"] for v in report["manual_check_items"]], ["필드2"]),
+        ("높은 신뢰도 비율", report["summary"]["high_confidence_rate"], "25.0%"),
+    ]
+    
+    for description, result, expected in test_cases:
+        status = "✅ PASS" if result == expected else "❌ FAIL"
+        print(f"{status} {description}")
+        print(f"   기대값: {expected}")
+        print(f"   실제값: {result}")
+        print()
+    
+    print()
+
+
 def main():
     """메인 테스트 실행"""
     print("\n" + "=" * 60)
@@ -136,6 +365,12 @@ def main():
     
     try:
         test_announcement_date_parsing()
+        # 엔진 의존 없는 단위 테스트를 먼저 실행 (아래 엔진 테스트 실패 시에도 결과 확인 가능)
+        test_rental_unit_area_comparison()
+        test_extract_number()
+        test_applicant_type_from_owner_name()
+        test_announcement_parser_extractors()
+        test_confidence_level()
         test_corporate_validation()
         test_date_validity()
         